@@ -16,6 +16,23 @@ __version__ = "0.1.0"
 __author__ = "PET Rocket Safety Project"
 __license__ = "MIT"
 
-from rocket_sim import combustion, system_model, fem, utils
+import importlib
 
 __all__ = ["combustion", "system_model", "fem", "utils"]
+
+
+def __getattr__(name):
+    """Import subpackages on first access (PEP 562).
+
+    ``import rocket_sim`` stays cheap; Cantera, SciPy and matplotlib are
+    only loaded once the subpackage that needs them is used.
+    """
+    if name in __all__:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
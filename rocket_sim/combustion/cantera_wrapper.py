@@ -10,19 +10,62 @@ Pass Criteria: P_max within 5% of published H₂/O₂ data
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 import numpy as np
 
-try:
-    import cantera as ct
-except ImportError:
-    raise ImportError(
-        "Cantera is required for combustion simulations. "
-        "Install with: conda install -c cantera cantera"
-    )
+
+def _import_cantera():
+    """
+    Import Cantera on first use.
+
+    Cantera's extension module takes a noticeable time to load; deferring it
+    keeps importing this module (and, through CombustionResult, the system
+    model) cheap until a combustion calculation is actually run.
+    """
+    try:
+        import cantera as ct
+    except ImportError:
+        raise ImportError(
+            "Cantera is required for combustion simulations. "
+            "Install with: conda install -c cantera cantera"
+        )
+    return ct
+
+
+@lru_cache(maxsize=8)
+def _mechanism_definition(mechanism: str):
+    """
+    Parse a mechanism file once and return its phase definition.
+
+    Parsing is the largest fixed cost of a short combustion run (~5 ms), so
+    the thermo and kinetics models, species and reactions are kept per
+    mechanism. No Solution is cached: its state is mutable.
+    """
+    gas = _import_cantera().Solution(mechanism)
+    return (gas.thermo_model, gas.kinetics_model,
+            tuple(gas.species()), tuple(gas.reactions()))
+
+
+def _load_mechanism(mechanism: str):
+    """
+    Return a new Cantera Solution for a mechanism.
+
+    Built from the cached definition (~0.4 ms instead of re-parsing the
+    file), and never shared, so callers on different threads (e.g. the GUI
+    worker) cannot overwrite each other's state.
+    """
+    thermo, kinetics, species, reactions = _mechanism_definition(mechanism)
+    return _import_cantera().Solution(thermo=thermo, kinetics=kinetics,
+                                      species=species, reactions=reactions)
 
 
-@dataclass
+def _mixture_composition(mix_ratio: float) -> Dict[str, float]:
+    """Mole fractions of an H₂/O₂ mixture with H₂:O₂ = mix_ratio:1."""
+    return {'H2': mix_ratio / (mix_ratio + 1.0), 'O2': 1.0 / (mix_ratio + 1.0)}
+
+
+@dataclass(slots=True)
 class CombustionResult:
     """
     Container for combustion simulation results.
@@ -57,6 +100,26 @@ class CombustionResult:
         }
 
 
+# Input checks for validate_combustion_inputs, applied in order; the first
+# violated rule is reported. Each predicate takes (volume, mix_ratio, T0, P0).
+_COMBUSTION_INPUT_RULES = (
+    (lambda V, MR, T0, P0: V <= 0,
+     "Volume must be positive, got {volume} m³"),
+    # 10 liters - limit for PET bottle context
+    (lambda V, MR, T0, P0: V > 0.01,
+     "Volume {volume} m³ exceeds typical PET bottle range (< 0.01 m³)"),
+    (lambda V, MR, T0, P0: MR <= 0,
+     "Mix ratio must be positive, got {mix_ratio}"),
+    (lambda V, MR, T0, P0: MR < 0.5 or MR > 10.0,
+     "Mix ratio {mix_ratio} outside reasonable range [0.5, 10.0]"),
+    (lambda V, MR, T0, P0: T0 < 200 or T0 > 500,
+     "Initial temperature {T0} K outside range [200, 500] K"),
+    # 0.05 to 5 bar
+    (lambda V, MR, T0, P0: P0 < 5000 or P0 > 500000,
+     "Initial pressure {P0} Pa outside range [5000, 500000] Pa"),
+)
+
+
 def validate_combustion_inputs(
     volume: float,
     mix_ratio: float,
@@ -77,25 +140,75 @@ def validate_combustion_inputs(
 
     Requirements: FR-9 (Input validation)
     """
-    if volume <= 0:
-        return False, f"Volume must be positive, got {volume} m³"
+    for violated, message in _COMBUSTION_INPUT_RULES:
+        if violated(volume, mix_ratio, T0, P0):
+            return False, message.format(volume=volume, mix_ratio=mix_ratio,
+                                         T0=T0, P0=P0)
 
-    if volume > 0.01:  # 10 liters - warning for PET bottle context
-        return False, f"Volume {volume} m³ exceeds typical PET bottle range (< 0.01 m³)"
+    return True, "Inputs valid"
 
-    if mix_ratio <= 0:
-        return False, f"Mix ratio must be positive, got {mix_ratio}"
 
-    if mix_ratio < 0.5 or mix_ratio > 10.0:
-        return False, f"Mix ratio {mix_ratio} outside reasonable range [0.5, 10.0]"
+def _reduce_pressure_trace(pressure: np.ndarray, dt: float) -> Tuple[float, float]:
+    """
+    Peak pressure and peak |dP/dt| of a uniformly sampled trace.
 
-    if T0 < 200 or T0 > 500:
-        return False, f"Initial temperature {T0} K outside range [200, 500] K"
+    Equivalent to ``max(P)`` and ``max(abs(np.gradient(P, dt)))`` (central
+    differences inside, one-sided at the ends) but without materialising
+    the gradient: the extreme central difference is found first and
+    divided by 2·dt once, which is exact because division by a positive
+    scalar preserves ordering.
 
-    if P0 < 5000 or P0 > 500000:  # 0.05 to 5 bar
-        return False, f"Initial pressure {P0} Pa outside range [5000, 500000] Pa"
+    Args:
+        pressure: Pressure samples [Pa], at least two
+        dt: Sample spacing [s]
+
+    Returns:
+        Tuple of (peak_pressure, max_dPdt)
+    """
+    if pressure.size < 2:
+        raise ValueError("At least two pressure samples are required")
+
+    max_dPdt = max(abs(pressure[1] - pressure[0]),
+                   abs(pressure[-1] - pressure[-2])) / dt
+    if pressure.size > 2:
+        central = np.subtract(pressure[2:], pressure[:-2])
+        span = max(central.max(), -central.min())
+        max_dPdt = max(max_dPdt, span / (2.0 * dt))
+
+    return pressure.max(), max_dPdt
 
-    return True, "Inputs valid"
+
+def _ignition_time_grid(end_time: float, n_points: int,
+                        ignition_window: float) -> np.ndarray:
+    """
+    Sample times dense over the ignition window and sparse afterwards.
+
+    Half of the samples are spaced uniformly over [0, ignition_window];
+    the rest are spaced geometrically from there to end_time, where the
+    burnt gas only relaxes towards equilibrium.
+
+    Args:
+        end_time: Simulation duration [s]
+        n_points: Total number of samples, at least four
+        ignition_window: End of the densely sampled region [s]
+
+    Returns:
+        Strictly increasing sample times [s], starting at 0 and ending at
+        end_time
+    """
+    if not 0 < ignition_window < end_time:
+        raise ValueError(
+            f"ignition_window {ignition_window} s must lie inside (0, {end_time}) s"
+        )
+    if n_points < 4:
+        raise ValueError("At least four samples are required for an ignition grid")
+
+    n_dense = n_points // 2
+    times = np.empty(n_points)
+    times[:n_dense] = np.linspace(0, ignition_window, n_dense)
+    times[n_dense:] = np.geomspace(ignition_window, end_time,
+                                   n_points - n_dense + 1)[1:]
+    return times
 
 
 def simulate_combustion(
@@ -106,7 +219,8 @@ def simulate_combustion(
     mechanism: str = 'h2o2.yaml',
     end_time: float = 0.01,
     n_points: int = 1000,
-    validate_inputs: bool = True
+    validate_inputs: bool = True,
+    ignition_window: Optional[float] = None
 ) -> CombustionResult:
     """
     Simulate constant-volume H₂/O₂ combustion using Cantera.
@@ -123,6 +237,12 @@ def simulate_combustion(
         end_time: Simulation duration [s]. Default 10 ms
         n_points: Number of output points
         validate_inputs: Whether to validate inputs (recommended)
+        ignition_window: If given, sample half of the output points
+            uniformly over [0, ignition_window] s and the rest
+            geometrically up to end_time, instead of uniformly over the
+            whole run. The ignition front of a spark-ignited H₂/O₂ mixture
+            takes a few tens of µs, so e.g. 1e-4 resolves it (and max_dPdt)
+            with a small fraction of the points a uniform grid would need.
 
     Returns:
         CombustionResult object containing time series and peak values
@@ -161,21 +281,18 @@ def simulate_combustion(
                 message=f"Input validation failed: {msg}"
             )
 
-    try:
-        # Create gas object with H₂/O₂ mechanism
-        gas = ct.Solution(mechanism)
-
-        # Set initial mixture composition
-        # X is mole fraction: H2:O2 = mix_ratio:1
-        X_H2 = mix_ratio / (mix_ratio + 1.0)
-        X_O2 = 1.0 / (mix_ratio + 1.0)
+    ct = _import_cantera()
 
-        gas.TPX = T0, P0, {'H2': X_H2, 'O2': X_O2}
+    try:
+        # Gas object with H₂/O₂ mechanism (file parsed once, state set below)
+        gas = _load_mechanism(mechanism)
 
         # Ignite the mixture by raising temperature temporarily
         # This simulates spark ignition
         T_ignition = max(T0, 1200.0)  # Ensure ignition temperature
-        gas.TP = T_ignition, P0
+
+        # Set the ignition state and mixture composition in one assignment
+        gas.TPX = T_ignition, P0, _mixture_composition(mix_ratio)
 
         # Create constant-volume reactor
         reactor = ct.IdealGasReactor(gas)
@@ -184,24 +301,36 @@ def simulate_combustion(
         # Create reactor network
         reactor_net = ct.ReactorNet([reactor])
 
-        # Storage arrays
-        times = np.linspace(0, end_time, n_points)
-        pressures = np.zeros(n_points)
-        temperatures = np.zeros(n_points)
-
-        # Time integration
-        for i, t in enumerate(times):
-            reactor_net.advance(t)
-            pressures[i] = reactor.thermo.P
-            temperatures[i] = reactor.thermo.T
+        # Storage arrays (every slot is written below, so no zero-fill)
+        if ignition_window is None:
+            times = np.linspace(0, end_time, n_points)
+        else:
+            times = _ignition_time_grid(end_time, n_points, ignition_window)
+        pressures = np.empty(n_points)
+        temperatures = np.empty(n_points)
+
+        # Time integration: the bound advance method, the reactor's phase
+        # looked up once and plain-float sample times keep per-sample Python
+        # overhead out of the Cantera calls. Cantera 3.2 renamed
+        # Reactor.thermo to phase (and deprecated thermo, which warned on
+        # every access); both return the same object for the whole run.
+        advance = reactor_net.advance
+        phase = reactor.phase if hasattr(reactor, 'phase') else reactor.thermo
+        for i, t in enumerate(times.tolist()):
+            advance(t)
+            pressures[i] = phase.P
+            temperatures[i] = phase.T
 
         # Calculate derived quantities
-        peak_pressure = np.max(pressures)
-
-        # Calculate dP/dt using central differences
-        dt = times[1] - times[0]
-        dPdt = np.gradient(pressures, dt)
-        max_dPdt = np.max(np.abs(dPdt))
+        if ignition_window is None:
+            dt = times[1] - times[0]
+            peak_pressure, max_dPdt = _reduce_pressure_trace(pressures, dt)
+        else:
+            # Non-uniform spacing: np.gradient's second-order formula, with
+            # the magnitude taken in place (no second temporary)
+            peak_pressure = pressures.max()
+            dPdt = np.gradient(pressures, times)
+            max_dPdt = np.abs(dPdt, out=dPdt).max()
 
         return CombustionResult(
             time=times,
@@ -225,11 +354,43 @@ def simulate_combustion(
         )
 
 
+@lru_cache(maxsize=128)
+def _equilibrium_state(
+    mix_ratio: float,
+    T0: float,
+    P0: float,
+    mechanism: str
+) -> Tuple[float, float, Tuple[str, ...], np.ndarray]:
+    """
+    Equilibrate an H₂/O₂ mixture at constant U,V.
+
+    Memoized on the (hashable) inputs: the result is a pure function of
+    them, and loading the mechanism plus the equilibrium solve dominate the
+    cost, so repeated checks of the same mixture are free after the first.
+    Returns immutable values only (the mole fractions are a read-only
+    array), so cached results cannot be modified by callers.
+
+    Returns:
+        (T_eq [K], P_eq [Pa], species names, mole fractions in that order)
+    """
+    gas = _load_mechanism(mechanism)
+    gas.TPX = T0, P0, _mixture_composition(mix_ratio)
+
+    # Equilibrate at constant U,V (adiabatic, constant volume)
+    gas.equilibrate('UV')
+
+    mole_fractions = gas.X
+    mole_fractions.flags.writeable = False
+
+    return gas.T, gas.P, tuple(gas.species_names), mole_fractions
+
+
 def get_equilibrium_properties(
     mix_ratio: float = 2.0,
     T0: float = 300.0,
     P0: float = 101325.0,
-    mechanism: str = 'h2o2.yaml'
+    mechanism: str = 'h2o2.yaml',
+    as_dict: bool = True
 ) -> Dict:
     """
     Calculate equilibrium properties for H₂/O₂ combustion.
@@ -242,42 +403,48 @@ def get_equilibrium_properties(
         T0: Initial temperature [K]
         P0: Initial pressure [Pa]
         mechanism: Cantera mechanism file
+        as_dict: Also build the per-species composition dictionary. The
+            species/mole_fractions arrays carry the same data without a
+            Python object per species, which matters for large mechanisms.
 
     Returns:
         Dictionary with equilibrium properties:
             - T_eq: Equilibrium temperature [K]
             - P_eq: Equilibrium pressure [Pa]
-            - composition: Species mole fractions
+            - species: Species names (tuple, mechanism order)
+            - mole_fractions: Mole fractions in species order (read-only array)
+            - composition: Species mole fractions as a dict (if as_dict)
 
     Requirements: FR-9 (Analytical checks)
     """
-    try:
-        gas = ct.Solution(mechanism)
-
-        X_H2 = mix_ratio / (mix_ratio + 1.0)
-        X_O2 = 1.0 / (mix_ratio + 1.0)
-
-        gas.TPX = T0, P0, {'H2': X_H2, 'O2': X_O2}
-
-        # Store initial state
-        initial_enthalpy = gas.enthalpy_mass
-        initial_volume = gas.volume_mass
+    # A missing Cantera is an installation error, not a failed calculation
+    _import_cantera()
 
-        # Equilibrate at constant U,V (adiabatic, constant volume)
-        gas.equilibrate('UV')
+    try:
+        # Memoized per distinct mixture; the dicts are built fresh per call
+        T_eq, P_eq, species, mole_fractions = _equilibrium_state(
+            mix_ratio, T0, P0, mechanism
+        )
 
-        return {
-            "T_eq": gas.T,
-            "P_eq": gas.P,
-            "composition": {s: gas[s].X[0] for s in gas.species_names},
+        properties = {
+            "T_eq": T_eq,
+            "P_eq": P_eq,
+            "species": species,
+            "mole_fractions": mole_fractions,
             "success": True,
             "message": "Equilibrium calculation successful"
         }
+        if as_dict:
+            properties["composition"] = dict(zip(species, mole_fractions.tolist()))
+
+        return properties
 
     except Exception as e:
         return {
             "T_eq": 0.0,
             "P_eq": 0.0,
+            "species": (),
+            "mole_fractions": np.empty(0),
             "composition": {},
             "success": False,
             "message": f"Equilibrium calculation failed: {str(e)}"
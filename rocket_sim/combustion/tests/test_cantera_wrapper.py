@@ -276,6 +276,66 @@ class TestCombustionSimulation:
         assert len(result.time) == 0
         assert len(result.pressure) == 0
 
+    def test_repeated_runs_are_identical(self):
+        """Test that reusing the loaded mechanism leaves no state between runs."""
+        kwargs = dict(volume=0.001, mix_ratio=2.0, end_time=0.001, n_points=50)
+
+        first = simulate_combustion(**kwargs)
+        simulate_combustion(volume=0.0005, mix_ratio=4.0, T0=350.0,
+                            end_time=0.001, n_points=50)
+        second = simulate_combustion(**kwargs)
+
+        assert np.array_equal(first.pressure, second.pressure)
+        assert np.array_equal(first.temperature, second.temperature)
+
+    def test_concurrent_runs_match_sequential_runs(self):
+        """Test that runs on worker threads do not share gas state."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        cases = [dict(volume=0.001, mix_ratio=ratio, end_time=0.001, n_points=50)
+                 for ratio in (1.5, 2.0, 3.0, 4.0)]
+
+        sequential = [simulate_combustion(**kwargs) for kwargs in cases]
+        with ThreadPoolExecutor(max_workers=len(cases)) as pool:
+            concurrent = list(pool.map(lambda kwargs: simulate_combustion(**kwargs),
+                                       cases))
+
+        for expected, result in zip(sequential, concurrent):
+            assert np.array_equal(expected.pressure, result.pressure)
+            assert np.array_equal(expected.temperature, result.temperature)
+
+    def test_derived_quantities_match_gradient(self):
+        """Test that peak pressure and max dP/dt match np.gradient post-processing."""
+        result = simulate_combustion(volume=0.001, mix_ratio=2.0,
+                                     end_time=0.001, n_points=50)
+
+        dt = result.time[1] - result.time[0]
+        assert result.peak_pressure == np.max(result.pressure)
+        assert result.max_dPdt == np.max(np.abs(np.gradient(result.pressure, dt)))
+
+    def test_ignition_window_resolves_pressure_rise(self):
+        """Test that a dense ignition window beats a finer uniform grid on dP/dt."""
+        uniform = simulate_combustion(volume=0.001, mix_ratio=2.0,
+                                      end_time=0.01, n_points=1000)
+        adaptive = simulate_combustion(volume=0.001, mix_ratio=2.0,
+                                       end_time=0.01, n_points=200,
+                                       ignition_window=1e-4)
+
+        assert adaptive.success
+        assert adaptive.time[0] == 0.0
+        assert adaptive.time[-1] == pytest.approx(0.01)
+        assert np.all(np.diff(adaptive.time) > 0)
+        assert adaptive.peak_pressure == pytest.approx(uniform.peak_pressure, rel=1e-6)
+        assert adaptive.max_dPdt > uniform.max_dPdt
+
+    def test_ignition_window_outside_run_fails(self):
+        """Test that an ignition window longer than the run is rejected."""
+        result = simulate_combustion(volume=0.001, mix_ratio=2.0, end_time=0.001,
+                                     n_points=100, ignition_window=0.002)
+
+        assert not result.success
+        assert "ignition_window" in result.message
+
 
 class TestEquilibriumCalculations:
     """Test suite for equilibrium property calculations."""
@@ -306,6 +366,31 @@ class TestEquilibriumCalculations:
         assert eq_props['T_eq'] > 1000
         assert eq_props['T_eq'] < 3500
 
+    def test_equilibrium_repeat_returns_fresh_dict(self):
+        """Test that repeated (memoized) calls do not share mutable results."""
+        first = get_equilibrium_properties(mix_ratio=3.0)
+        first['composition'].clear()
+
+        second = get_equilibrium_properties(mix_ratio=3.0)
+
+        assert second['success'] is True
+        assert second['T_eq'] == first['T_eq']
+        assert sum(second['composition'].values()) == pytest.approx(1.0)
+
+    def test_equilibrium_composition_arrays(self):
+        """Test that the species/mole-fraction arrays match the composition dict."""
+        eq_props = get_equilibrium_properties(mix_ratio=2.0)
+        arrays_only = get_equilibrium_properties(mix_ratio=2.0, as_dict=False)
+
+        species = eq_props['species']
+        X = eq_props['mole_fractions']
+        assert len(species) == len(X)
+        assert dict(zip(species, X)) == eq_props['composition']
+        assert X[species.index('H2O')] > 0.1
+        assert not X.flags.writeable
+        assert 'composition' not in arrays_only
+        assert np.array_equal(arrays_only['mole_fractions'], X)
+
 
 class TestPhysicalConsistency:
     """Test suite for physical consistency checks."""
@@ -35,7 +35,9 @@ from .stress_concentrations import (
     calculate_end_cap_stress_factor,
     calculate_thread_stress_factor,
     calculate_transition_radius_factor,
+    MaximumStress,
     calculate_maximum_stress,
+    calculate_maximum_stress_state,
     estimate_failure_location,
 )
 
@@ -56,6 +58,8 @@ __all__ = [
     "calculate_end_cap_stress_factor",
     "calculate_thread_stress_factor",
     "calculate_transition_radius_factor",
+    "MaximumStress",
     "calculate_maximum_stress",
+    "calculate_maximum_stress_state",
     "estimate_failure_location",
 ]
@@ -13,7 +13,7 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class VesselMesh:
     """
     Simple structured mesh for cylindrical pressure vessel.
@@ -68,37 +68,27 @@ def create_axisymmetric_mesh(
     r = np.linspace(inner_radius, outer_radius, n_radial + 1)
     z = np.linspace(0, length, n_axial + 1)
 
-    # Generate nodes
-    nodes = []
-    node_id = {}
-
-    for i, z_val in enumerate(z):
-        for j, r_val in enumerate(r):
-            node_id[(i, j)] = len(nodes)
-            nodes.append([r_val, z_val, 0.0])  # r, z, theta=0
-
-    nodes = np.array(nodes)
-
-    # Generate quad elements (4 nodes per element)
-    elements = []
-
-    for i in range(n_axial):
-        for j in range(n_radial):
-            # Quad element nodes (counter-clockwise)
-            n1 = node_id[(i, j)]
-            n2 = node_id[(i, j+1)]
-            n3 = node_id[(i+1, j+1)]
-            n4 = node_id[(i+1, j)]
-            elements.append([n1, n2, n3, n4])
-
-    elements = np.array(elements)
+    # Generate nodes: row i of the grid is axial station z[i], column j is
+    # radial station r[j]; nodes are numbered row by row
+    R, Z = np.meshgrid(r, z)
+    nodes = np.column_stack([R.ravel(), Z.ravel(), np.zeros(R.size)])  # r, z, theta=0
+    node_id = np.arange(R.size).reshape(R.shape)
+
+    # Generate quad elements (4 nodes per element, counter-clockwise),
+    # one per grid cell in the same row-by-row order
+    elements = np.stack([
+        node_id[:-1, :-1],  # (i, j)
+        node_id[:-1, 1:],   # (i, j+1)
+        node_id[1:, 1:],    # (i+1, j+1)
+        node_id[1:, :-1],   # (i+1, j)
+    ], axis=-1).reshape(-1, 4)
 
     # Identify boundary nodes
     boundary_nodes = {
-        'inner': [node_id[(i, 0)] for i in range(n_axial + 1)],  # Inner surface
-        'outer': [node_id[(i, n_radial)] for i in range(n_axial + 1)],  # Outer surface
-        'bottom': [node_id[(0, j)] for j in range(n_radial + 1)],  # Bottom edge
-        'top': [node_id[(n_axial, j)] for j in range(n_radial + 1)]  # Top edge
+        'inner': node_id[:, 0].tolist(),  # Inner surface
+        'outer': node_id[:, -1].tolist(),  # Outer surface
+        'bottom': node_id[0].tolist(),  # Bottom edge
+        'top': node_id[-1].tolist()  # Top edge
     }
 
     return VesselMesh(
@@ -138,7 +128,8 @@ def create_1d_radial_mesh(
     nodes = np.column_stack([r, np.zeros_like(r), np.zeros_like(r)])  # r, z=0, θ=0
 
     # Create line elements (2 nodes per element)
-    elements = np.array([[i, i+1] for i in range(n_elements)])
+    first = np.arange(n_elements)
+    elements = np.column_stack([first, first + 1])
 
     # Boundary nodes
     boundary_nodes = {
@@ -176,36 +167,34 @@ def calculate_mesh_quality(mesh: VesselMesh) -> Dict[str, float]:
         'node_count': len(mesh.nodes),
     }
 
-    # Calculate element sizes
-    element_sizes = []
-    aspect_ratios = []
+    # Element sizes and aspect ratios for all elements at once: gather the
+    # (n_elements, nodes_per_element, 3) node coordinates in one indexing op
+    n_elements = len(mesh.elements)
+    element_sizes = np.zeros(n_elements)
+    aspect_ratios = np.ones(n_elements)
 
-    for elem in mesh.elements:
-        # Get element nodes
-        elem_nodes = mesh.nodes[elem]
+    if n_elements:
+        elem_nodes = mesh.nodes[mesh.elements]
+        nodes_per_element = elem_nodes.shape[1]
 
-        if len(elem) == 2:  # Line element
-            size = np.linalg.norm(elem_nodes[1] - elem_nodes[0])
-            element_sizes.append(size)
-            aspect_ratios.append(1.0)
+        if nodes_per_element == 2:  # Line elements
+            element_sizes = np.linalg.norm(elem_nodes[:, 1] - elem_nodes[:, 0], axis=-1)
 
-        elif len(elem) == 4:  # Quad element
-            # Calculate edge lengths
-            e1 = np.linalg.norm(elem_nodes[1] - elem_nodes[0])
-            e2 = np.linalg.norm(elem_nodes[2] - elem_nodes[1])
-            e3 = np.linalg.norm(elem_nodes[3] - elem_nodes[2])
-            e4 = np.linalg.norm(elem_nodes[0] - elem_nodes[3])
+        elif nodes_per_element == 4:  # Quad elements
+            # Edge lengths n0→n1, n1→n2, n2→n3, n3→n0
+            edges = np.linalg.norm(np.roll(elem_nodes, -1, axis=1) - elem_nodes, axis=-1)
 
-            min_edge = min(e1, e2, e3, e4)
-            max_edge = max(e1, e2, e3, e4)
+            min_edge = edges.min(axis=1)
+            max_edge = edges.max(axis=1)
 
-            element_sizes.append(min_edge)
-            aspect_ratios.append(max_edge / min_edge if min_edge > 0 else 1.0)
+            element_sizes = min_edge
+            with np.errstate(divide='ignore', invalid='ignore'):
+                aspect_ratios = np.where(min_edge > 0, max_edge / min_edge, 1.0)
 
-    if element_sizes:
-        metrics['min_element_size'] = min(element_sizes)
-        metrics['max_element_size'] = max(element_sizes)
-        metrics['aspect_ratio'] = np.mean(aspect_ratios)
+    if n_elements:
+        metrics['min_element_size'] = element_sizes.min()
+        metrics['max_element_size'] = element_sizes.max()
+        metrics['aspect_ratio'] = aspect_ratios.mean()
     else:
         metrics['min_element_size'] = 0.0
         metrics['max_element_size'] = 0.0
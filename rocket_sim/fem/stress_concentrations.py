@@ -8,14 +8,65 @@ ISO/IEC/IEEE 12207:2017 - Implementation Process
 Requirements: FR-4 (FEM stress analysis), NFR-9 (Safety warnings)
 """
 
+import math
 import numpy as np
-from typing import Dict, Optional
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, Mapping, NamedTuple, Optional, Union
 import warnings
 
-from ..system_model.burst_calculator import VesselGeometry, calculate_stress_state
+from ..system_model.burst_calculator import VesselGeometry, calculate_hoop_stress
 from ..system_model.materials import MaterialProperties
 
 
+# End cap stress concentration factors K_t (Roark, Peterson), read-only
+END_CAP_STRESS_FACTORS: Mapping[str, float] = MappingProxyType({
+    "hemispherical": 1.0,    # Ideal - membrane stress only
+    "elliptical": 1.5,       # 2:1 elliptical head
+    "torispherical": 1.8,    # ASME F&D head
+    "conical": 1.5,          # 60-degree cone
+    "flat": 2.5,             # Flat plate - high bending stress
+})
+
+
+class MaximumStress(NamedTuple):
+    """
+    Maximum stress including stress concentrations.
+
+    Attributes:
+        sigma_nominal: Nominal hoop stress (Pa)
+        K_cap: End cap stress factor
+        K_thread: Thread stress factor, None if not included
+        K_transition: Transition stress factor, None if not included
+        K_total: Combined stress factor
+        sigma_max: Maximum stress (Pa)
+        location: Critical location (an array of locations, one per
+            element, for array geometries)
+    """
+    sigma_nominal: float
+    K_cap: float
+    K_thread: Optional[float]
+    K_transition: Optional[float]
+    K_total: float
+    sigma_max: float
+    location: str
+
+
+# Typical bottle neck-to-body transition: 28 mm neck, 5 mm fillet radius
+_BOTTLE_NECK_DIAMETER = 0.028
+_BOTTLE_NECK_FILLET_RADIUS = 0.005
+
+# Stress-raising features compared in calculate_maximum_stress_state, in
+# tie-breaking order (the first feature wins on equal factors)
+_STRESS_LOCATIONS = ("End cap", "Thread root", "Neck transition")
+
+# Realistic thread K_t range, and the conservative value for a zero root
+# radius (shared by the scalar and array paths of _peterson_thread_factor)
+_THREAD_K_MIN = 2.0
+_THREAD_K_MAX = 4.5
+_THREAD_K_ZERO_RADIUS = 4.0
+
+
 def calculate_end_cap_stress_factor(
     geometry: VesselGeometry,
     cap_type: str = "hemispherical"
@@ -48,24 +99,16 @@ def calculate_end_cap_stress_factor(
         >>> K_flat = calculate_end_cap_stress_factor(geom, "flat")
         >>> print(f"Hemispherical: K={K_hemi:.2f}, Flat: K={K_flat:.2f}")
     """
-    cap_factors = {
-        "hemispherical": 1.0,    # Ideal - membrane stress only
-        "elliptical": 1.5,       # 2:1 elliptical head
-        "torispherical": 1.8,    # ASME F&D head
-        "conical": 1.5,          # 60-degree cone
-        "flat": 2.5,             # Flat plate - high bending stress
-    }
-
     cap_type_lower = cap_type.lower()
 
-    if cap_type_lower not in cap_factors:
-        available = ", ".join(cap_factors.keys())
+    if cap_type_lower not in END_CAP_STRESS_FACTORS:
+        available = ", ".join(END_CAP_STRESS_FACTORS.keys())
         raise ValueError(
             f"Unknown cap type '{cap_type}'. "
             f"Available: {available}"
         )
 
-    K_t = cap_factors[cap_type_lower]
+    K_t = END_CAP_STRESS_FACTORS[cap_type_lower]
 
     # Add warning for flat caps
     if cap_type_lower == "flat":
@@ -80,22 +123,28 @@ def calculate_end_cap_stress_factor(
 
 def calculate_thread_stress_factor(
     geometry: VesselGeometry,
-    thread_depth: Optional[float] = None,
-    thread_radius: Optional[float] = None
-) -> float:
+    thread_depth: Optional[Union[float, np.ndarray]] = None,
+    thread_radius: Optional[Union[float, np.ndarray]] = None
+) -> Union[float, np.ndarray]:
     """
     Calculate stress concentration factor for threaded neck/closure.
 
     Threads create significant stress concentrations, especially
     in brittle materials like PET.
 
+    Thread depth and root radius may be arrays (a closure design sweep);
+    the whole sweep is then evaluated in one vectorized pass.
+
     Args:
         geometry: Vessel geometry
-        thread_depth: Thread depth (m), default to wall_thickness/2
-        thread_radius: Root radius (m), default to thread_depth/4
+        thread_depth: Thread depth (m), default to wall_thickness/2,
+            scalar or array
+        thread_radius: Root radius (m), default to thread_depth/4,
+            scalar or array
 
     Returns:
-        Stress concentration factor K_t
+        Stress concentration factor K_t (float for scalar input,
+        array of the broadcast shape for array input)
 
     Reference:
         Peterson's Stress Concentration Factors, Fig. 4.72-4.74
@@ -110,31 +159,52 @@ def calculate_thread_stress_factor(
         thread_depth = geometry.wall_thickness / 2
 
     if thread_radius is None:
-        thread_radius = thread_depth / 4  # Sharp threads
+        # The default root radius fixes h/r = 4, so K_t does not depend on
+        # the geometry (the common case: every caller in this package)
+        if np.ndim(thread_depth) == 0 and thread_depth > 0:
+            return _SHARP_THREAD_STRESS_FACTOR
+        thread_radius = np.asarray(thread_depth, dtype=np.float64) / 4  # Sharp threads
+
+    return _peterson_thread_factor(thread_depth, thread_radius)
 
-    # Normalized parameters
-    t = geometry.wall_thickness
-    h = thread_depth
-    r = thread_radius
 
+def _peterson_thread_factor(
+    thread_depth: Union[float, np.ndarray],
+    thread_radius: Union[float, np.ndarray]
+) -> Union[float, np.ndarray]:
+    """Thread K_t from depth and root radius (float for scalar input)."""
     # Peterson's formula (simplified)
-    # K_t ≈ 1 + 2*sqrt(h/r) for sharp notches
-    if r > 0:
-        K_t = 1 + 2 * np.sqrt(h / r)
-    else:
-        K_t = 4.0  # Very sharp thread - conservative
+    # K_t ≈ 1 + 2*sqrt(h/r) for sharp notches; very sharp threads (r = 0)
+    # → 4.0, conservative
+    if isinstance(thread_depth, (int, float)) and isinstance(thread_radius, (int, float)):
+        h = thread_depth
+        r = thread_radius
+        if r > 0 and h >= 0:
+            # Scalar fast path: builtins avoid the 0-d array round trip
+            K_t = 1 + 2 * math.sqrt(h / r)
+            return min(max(K_t, _THREAD_K_MIN), _THREAD_K_MAX)
+
+    h = np.asarray(thread_depth, dtype=np.float64)
+    r = np.asarray(thread_radius, dtype=np.float64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        K_t = np.where(r > 0, 1 + 2 * np.sqrt(h / r), _THREAD_K_ZERO_RADIUS)
 
     # Clamp to realistic range
-    K_t = np.clip(K_t, 2.0, 4.5)
+    K_t = np.clip(K_t, _THREAD_K_MIN, _THREAD_K_MAX)
+
+    return K_t if K_t.ndim else float(K_t)
 
-    return K_t
+
+# K_t for the default sharp thread (root radius = depth/4, i.e. h/r = 4)
+_SHARP_THREAD_STRESS_FACTOR = _peterson_thread_factor(4.0, 1.0)
 
 
 def calculate_transition_radius_factor(
     major_diameter: float,
     minor_diameter: float,
-    fillet_radius: float
-) -> float:
+    fillet_radius: Union[float, np.ndarray]
+) -> Union[float, np.ndarray]:
     """
     Calculate stress concentration for diameter transition with fillet.
 
@@ -143,80 +213,87 @@ def calculate_transition_radius_factor(
     Args:
         major_diameter: Larger diameter (m)
         minor_diameter: Smaller diameter (m)
-        fillet_radius: Transition fillet radius (m)
+        fillet_radius: Transition fillet radius (m), scalar or array
 
     Returns:
-        Stress concentration factor K_t
+        Stress concentration factor K_t (float for scalar input,
+        array of the same shape for array input)
 
     Reference:
         Peterson's Stress Concentration Factors, Chart 2.2
+
+    Example:
+        >>> radii = np.linspace(0.0, 0.005, 6)
+        >>> K = calculate_transition_radius_factor(0.095, 0.028, radii)
     """
     # Diameter ratio
     d_ratio = minor_diameter / major_diameter
 
     # Fillet radius ratio
-    r_ratio = fillet_radius / minor_diameter
+    r_ratio = np.asarray(fillet_radius, dtype=np.float64) / minor_diameter
 
     # Peterson's chart approximation (for tension)
-    # K_t ≈ 1 + 0.5/(r_ratio) for step in diameter
-    if r_ratio > 0:
-        K_t = 1 + 0.5 / np.sqrt(r_ratio)
-    else:
-        K_t = 3.0  # Sharp corner
+    # K_t ≈ 1 + 0.5/(r_ratio) for step in diameter; sharp corner → 3.0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        K_t = np.where(r_ratio > 0, 1 + 0.5 / np.sqrt(r_ratio), 3.0)
 
-    # Adjust for diameter ratio
-    K_t *= (1 + (1 - d_ratio))
+    # Adjust for diameter ratio (not in place: d_ratio may be an array of
+    # a different shape, e.g. a sweep over the major diameter)
+    K_t = K_t * (2 - d_ratio)
 
     # Clamp to reasonable range
     K_t = np.clip(K_t, 1.0, 3.5)
 
-    return K_t
+    return K_t if K_t.ndim else float(K_t)
 
 
-def calculate_maximum_stress(
-    pressure: float,
+def calculate_maximum_stress_state(
+    pressure: Union[float, np.ndarray],
     geometry: VesselGeometry,
     material: MaterialProperties,
     cap_type: str = "hemispherical",
     include_thread: bool = False,
     include_transition: bool = False
-) -> Dict[str, float]:
+) -> MaximumStress:
     """
     Calculate maximum stress including all stress concentrations.
 
+    Same as calculate_maximum_stress, but returns the fields as a
+    MaximumStress tuple for attribute access instead of a new dict.
+
+    The stress factors depend only on the geometry, so they (and the
+    critical location) are evaluated once per call; pressure may be an
+    array, in which case only sigma_nominal and sigma_max are broadcast
+    over it. A pressure sweep is then one call rather than one per point.
+
     Args:
-        pressure: Internal pressure (Pa)
-        geometry: Vessel geometry
+        pressure: Internal pressure (Pa), scalar or array
+        geometry: Vessel geometry; array dimensions give element-wise
+            factors, stresses and locations
         material: Material properties
         cap_type: End cap type
         include_thread: Include thread stress concentration
         include_transition: Include neck transition stress concentration
 
     Returns:
-        Dictionary with stresses:
-        - sigma_nominal: Nominal hoop stress (Pa)
-        - K_cap: End cap stress factor
-        - K_thread: Thread stress factor (if included)
-        - K_transition: Transition stress factor (if included)
-        - K_total: Combined stress factor
-        - sigma_max: Maximum stress (Pa)
-        - location: Critical location
+        MaximumStress with the nominal stress, stress factors, maximum
+        stress and critical location
 
     Example:
         >>> geom = VesselGeometry(inner_diameter=0.095, wall_thickness=0.0003)
         >>> pet = get_material("PET")
-        >>> result = calculate_maximum_stress(
+        >>> result = calculate_maximum_stress_state(
         ...     pressure=500e3,
         ...     geometry=geom,
         ...     material=pet,
         ...     cap_type="flat",
         ...     include_thread=True
         ... )
-        >>> print(f"Max stress: {result['sigma_max']/1e6:.1f} MPa at {result['location']}")
+        >>> print(f"Max stress: {result.sigma_max/1e6:.1f} MPa at {result.location}")
+        >>> sweep = calculate_maximum_stress_state(np.linspace(1e5, 1e6, 50), geom, pet)
     """
-    # Nominal stress (thin-wall hoop stress)
-    stress_state = calculate_stress_state(pressure, geometry)
-    sigma_nominal = stress_state.hoop_stress
+    # Nominal stress (thin-wall hoop stress; the other components are unused)
+    sigma_nominal = calculate_hoop_stress(pressure, geometry)
 
     # Calculate individual stress concentration factors
     K_cap = calculate_end_cap_stress_factor(geometry, cap_type)
@@ -227,41 +304,87 @@ def calculate_maximum_stress(
 
     K_transition = 1.0
     if include_transition:
-        # Assume typical bottle: 28mm neck, 95mm body, 5mm radius
+        # Assume typical bottle neck
         K_transition = calculate_transition_radius_factor(
-            major_diameter=geometry.inner_diameter,
-            minor_diameter=0.028,  # Typical bottle neck
-            fillet_radius=0.005    # 5mm radius
+            geometry.inner_diameter, _BOTTLE_NECK_DIAMETER, _BOTTLE_NECK_FILLET_RADIUS
         )
 
     # Combined stress concentration factor
     # Note: Factors don't simply multiply - we take maximum
     # since different features are at different locations
-    stress_concentrations = {
-        'cap': (K_cap, "End cap"),
-        'thread': (K_thread, "Thread root"),
-        'transition': (K_transition, "Neck transition")
-    }
-
-    # Find maximum stress concentration
-    max_K = max(K_cap, K_thread, K_transition)
-    location = stress_concentrations[
-        max(['cap', 'thread', 'transition'],
-            key=lambda x: stress_concentrations[x][0])
-    ][1]
+    # Find maximum stress concentration (first feature wins on ties)
+    factors = (K_cap, K_thread, K_transition)
+    if any(np.ndim(K) for K in factors):
+        # Array geometry: the governing feature is chosen per element
+        # (np.argmax also returns the first maximum on ties)
+        stacked = np.stack(np.broadcast_arrays(*factors))
+        governing = np.argmax(stacked, axis=0)
+        max_K = np.take_along_axis(stacked, governing[np.newaxis], axis=0)[0]
+        location = np.asarray(_STRESS_LOCATIONS)[governing]
+    else:
+        max_K, location = max(zip(factors, _STRESS_LOCATIONS), key=itemgetter(0))
 
     # Maximum stress
     sigma_max = max_K * sigma_nominal
 
-    return {
-        'sigma_nominal': sigma_nominal,
-        'K_cap': K_cap,
-        'K_thread': K_thread if include_thread else None,
-        'K_transition': K_transition if include_transition else None,
-        'K_total': max_K,
-        'sigma_max': sigma_max,
-        'location': location
-    }
+    return MaximumStress(
+        sigma_nominal=sigma_nominal,
+        K_cap=K_cap,
+        K_thread=K_thread if include_thread else None,
+        K_transition=K_transition if include_transition else None,
+        K_total=max_K,
+        sigma_max=sigma_max,
+        location=location
+    )
+
+
+def calculate_maximum_stress(
+    pressure: float,
+    geometry: VesselGeometry,
+    material: MaterialProperties,
+    cap_type: str = "hemispherical",
+    include_thread: bool = False,
+    include_transition: bool = False
+) -> Dict[str, float]:
+    """
+    Calculate maximum stress including all stress concentrations.
+
+    Dictionary view of calculate_maximum_stress_state.
+
+    Args:
+        pressure: Internal pressure (Pa)
+        geometry: Vessel geometry
+        material: Material properties
+        cap_type: End cap type
+        include_thread: Include thread stress concentration
+        include_transition: Include neck transition stress concentration
+
+    Returns:
+        Dictionary with stresses:
+        - sigma_nominal: Nominal hoop stress (Pa)
+        - K_cap: End cap stress factor
+        - K_thread: Thread stress factor (if included)
+        - K_transition: Transition stress factor (if included)
+        - K_total: Combined stress factor
+        - sigma_max: Maximum stress (Pa)
+        - location: Critical location
+
+    Example:
+        >>> geom = VesselGeometry(inner_diameter=0.095, wall_thickness=0.0003)
+        >>> pet = get_material("PET")
+        >>> result = calculate_maximum_stress(
+        ...     pressure=500e3,
+        ...     geometry=geom,
+        ...     material=pet,
+        ...     cap_type="flat",
+        ...     include_thread=True
+        ... )
+        >>> print(f"Max stress: {result['sigma_max']/1e6:.1f} MPa at {result['location']}")
+    """
+    return calculate_maximum_stress_state(
+        pressure, geometry, material, cap_type,
+        include_thread, include_transition
+    )._asdict()
 
 
 def estimate_failure_location(
@@ -302,6 +425,7 @@ def estimate_failure_location(
 
 # Demonstration
 if __name__ == "__main__":
+    import sys
     from ..system_model.materials import get_material
     from ..system_model.burst_calculator import VesselGeometry
 
@@ -322,24 +446,28 @@ if __name__ == "__main__":
     print(f"  Threads: K = {calculate_thread_stress_factor(geom):.2f}")
     print()
 
-    # Maximum stress analysis
-    print("Maximum Stress Analysis:")
-    print()
+    # Maximum stress analysis (rows collected and written in one call)
+    rows = ["Maximum Stress Analysis:", ""]
 
     for cap in ["hemispherical", "flat"]:
-        result = calculate_maximum_stress(P, geom, pet, cap_type=cap, include_thread=True)
-        print(f"{cap.capitalize()} cap:")
-        print(f"  Nominal stress: {result['sigma_nominal']/1e6:.1f} MPa")
-        print(f"  Stress factor (cap): {result['K_cap']:.2f}")
-        print(f"  Stress factor (thread): {result['K_thread']:.2f}")
-        print(f"  Total stress factor: {result['K_total']:.2f}")
-        print(f"  Maximum stress: {result['sigma_max']/1e6:.1f} MPa")
-        print(f"  Critical location: {result['location']}")
-        print(f"  Safety factor: {pet.yield_strength / result['sigma_max']:.2f}")
-        print()
+        result = calculate_maximum_stress_state(P, geom, pet, cap_type=cap,
+                                                include_thread=True)
+        rows += [
+            f"{cap.capitalize()} cap:",
+            f"  Nominal stress: {result.sigma_nominal/1e6:.1f} MPa",
+            f"  Stress factor (cap): {result.K_cap:.2f}",
+            f"  Stress factor (thread): {result.K_thread:.2f}",
+            f"  Total stress factor: {result.K_total:.2f}",
+            f"  Maximum stress: {result.sigma_max/1e6:.1f} MPa",
+            f"  Critical location: {result.location}",
+            f"  Safety factor: {pet.yield_strength / result.sigma_max:.2f}",
+            "",
+        ]
 
     # Failure prediction
-    print("Failure Location Prediction:")
+    rows.append("Failure Location Prediction:")
     for cap in ["hemispherical", "elliptical", "flat"]:
         location = estimate_failure_location(P, geom, cap)
-        print(f"  {cap.capitalize()} cap: {location}")
+        rows.append(f"  {cap.capitalize()} cap: {location}")
+
+    sys.stdout.write("\n".join(rows) + "\n")
@@ -11,6 +11,7 @@ from rocket_sim.fem.stress_concentrations import (
     calculate_thread_stress_factor,
     calculate_transition_radius_factor,
     calculate_maximum_stress,
+    calculate_maximum_stress_state,
     estimate_failure_location,
 )
 from rocket_sim.system_model import get_material, VesselGeometry
@@ -73,6 +74,46 @@ class TestThreadStressFactors:
 
         assert K_sharp > K_round
 
+    def test_default_thread_matches_explicit_geometry(self):
+        """Test that the default sharp thread equals its explicit geometry."""
+        geom = VesselGeometry(inner_diameter=0.095, wall_thickness=0.0003)
+        h = geom.wall_thickness / 2
+
+        K_default = calculate_thread_stress_factor(geom)
+        K_explicit = calculate_thread_stress_factor(geom, thread_depth=h,
+                                                    thread_radius=h / 4)
+
+        assert K_default == pytest.approx(K_explicit)
+
+    def test_thread_factor_array_matches_scalar(self):
+        """Test that a thread root-radius sweep matches pointwise evaluation."""
+        geom = VesselGeometry(inner_diameter=0.095, wall_thickness=0.0003)
+        radii = np.array([0.0, 0.00001, 0.00005, 0.0001, 0.001])
+
+        K_array = calculate_thread_stress_factor(geom, thread_radius=radii)
+
+        assert K_array.shape == radii.shape
+        for K, radius in zip(K_array, radii):
+            assert K == pytest.approx(
+                calculate_thread_stress_factor(geom, thread_radius=radius))
+
+
+class TestTransitionStressFactors:
+    """Test neck transition stress concentration factors."""
+
+    def test_transition_factor_array_matches_scalar(self):
+        """Test that a fillet-radius sweep matches pointwise evaluation."""
+        radii = np.array([0.0, 0.001, 0.005, 0.01, 0.02])
+        K_array = calculate_transition_radius_factor(0.030, 0.028, radii)
+
+        assert K_array.shape == radii.shape
+        for r, K in zip(radii, K_array):
+            assert K == pytest.approx(
+                calculate_transition_radius_factor(0.030, 0.028, r)
+            )
+        assert np.all((K_array >= 1.0) & (K_array <= 3.5))
+        assert np.all(np.diff(K_array[1:]) < 0)  # Larger fillets relieve stress
+
 
 class TestMaximumStress:
     """Test maximum stress calculation."""
@@ -93,6 +134,66 @@ class TestMaximumStress:
         # Max should be greater than nominal
         assert result['sigma_max'] > result['sigma_nominal']
 
+    def test_transition_factor_matches_general_formula(self):
+        """Test the built-in neck transition against the general fillet formula."""
+        pet = get_material("PET")
+        for D in [0.03, 0.05, 0.095]:
+            geom = VesselGeometry(inner_diameter=D, wall_thickness=0.0003)
+            state = calculate_maximum_stress_state(500e3, geom, pet,
+                                                   include_transition=True)
+            assert state.K_transition == pytest.approx(
+                calculate_transition_radius_factor(D, 0.028, 0.005))
+
+    def test_transition_factor_with_array_geometry(self):
+        """Test that array body diameters give element-wise transition results."""
+        pet = get_material("PET")
+        diameters = np.array([0.1, 0.09, 0.03])
+        geom = VesselGeometry(inner_diameter=diameters, wall_thickness=0.0003)
+
+        state = calculate_maximum_stress_state(1e6, geom, pet,
+                                               include_transition=True)
+
+        for i, D in enumerate(diameters):
+            point = calculate_maximum_stress_state(
+                1e6, VesselGeometry(inner_diameter=D, wall_thickness=0.0003), pet,
+                include_transition=True)
+            assert state.K_transition[i] == point.K_transition
+            assert state.K_total[i] == point.K_total
+            assert state.sigma_max[i] == point.sigma_max
+            assert state.location[i] == point.location
+
+    def test_maximum_stress_state_matches_dict(self):
+        """Test that the tuple form holds the same fields as the dict."""
+        geom = VesselGeometry(inner_diameter=0.095, wall_thickness=0.0003)
+        pet = get_material("PET")
+
+        state = calculate_maximum_stress_state(500e3, geom, pet, cap_type="flat",
+                                               include_thread=True)
+
+        assert state.sigma_max == state.K_total * state.sigma_nominal
+        assert state.K_transition is None
+        assert state._asdict() == calculate_maximum_stress(
+            500e3, geom, pet, cap_type="flat", include_thread=True)
+
+    def test_maximum_stress_state_broadcasts_over_pressure(self):
+        """Test that a pressure array matches point-by-point calls."""
+        geom = VesselGeometry(inner_diameter=0.095, wall_thickness=0.0003)
+        pet = get_material("PET")
+        pressures = np.linspace(100e3, 800e3, 8)
+
+        sweep = calculate_maximum_stress_state(pressures, geom, pet,
+                                               cap_type="elliptical",
+                                               include_transition=True)
+
+        for i, P in enumerate(pressures):
+            point = calculate_maximum_stress_state(P, geom, pet,
+                                                   cap_type="elliptical",
+                                                   include_transition=True)
+            assert sweep.sigma_max[i] == point.sigma_max
+            assert sweep.sigma_nominal[i] == point.sigma_nominal
+            assert sweep.K_total == point.K_total
+            assert sweep.location == point.location
+
     def test_hemispherical_vs_flat_stress(self):
         """Test that flat cap gives higher stress than hemispherical."""
         geom = VesselGeometry(inner_diameter=0.095, wall_thickness=0.0003)
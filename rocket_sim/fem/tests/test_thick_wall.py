@@ -90,6 +90,23 @@ class TestLameEquations:
         diffs = np.diff(result.sigma_theta)
         assert np.all(diffs <= 0)  # Non-increasing
 
+    def test_pressure_array_matches_scalar_solutions(self):
+        """Test that an array of pressures is solved row by row."""
+        pet = get_material("PET")
+        pressures = np.array([0.0, 300e3, 900e3])
+
+        batch = solve_lame_equations(0.05, 0.055, pressures,
+                                     material=pet, n_points=25)
+
+        assert batch.r.shape == (25,)
+        assert batch.sigma_theta.shape == (3, 25)
+        for row, P in enumerate(pressures):
+            single = solve_lame_equations(0.05, 0.055, P,
+                                          material=pet, n_points=25)
+            np.testing.assert_allclose(batch.sigma_vm[row], single.sigma_vm)
+            np.testing.assert_allclose(batch.sigma_z[row], single.sigma_z)
+            np.testing.assert_allclose(batch.u_r[row], single.u_r)
+
 
 class TestThickVsThinWall:
     """Test comparison between thick and thin-wall theories."""
@@ -112,6 +129,45 @@ class TestThickVsThinWall:
         assert comparison['thin_wall_valid']
         assert comparison['error_percent'] < 1.0  # < 1% error
 
+    def test_comparison_reuses_lame_solution(self):
+        """Test that a precomputed Lamé solution gives the same comparison."""
+        r_i = 0.0475
+        t = 0.0003
+        P = 500e3
+
+        geom = VesselGeometry(inner_diameter=2*r_i, wall_thickness=t)
+        pet = get_material("PET")
+        lame = solve_lame_equations(r_i, r_i + t, P, material=pet, n_points=20)
+
+        fresh = compare_thick_vs_thin_wall(geom, P, pet)
+        reused = compare_thick_vs_thin_wall(geom, P, pet, lame_result=lame)
+
+        for key in fresh:
+            assert reused[key] == pytest.approx(fresh[key])
+
+    def test_comparison_broadcasts_over_sweep(self):
+        """Test a pressure x diameter sweep against pointwise comparisons."""
+        pet = get_material("PET")
+        pressures = np.array([200e3, 500e3, 800e3])
+        diameters = np.array([0.08, 0.095, 0.11])
+
+        sweep = compare_thick_vs_thin_wall(
+            VesselGeometry(inner_diameter=diameters[np.newaxis, :],
+                           wall_thickness=0.0003),
+            pressures[:, np.newaxis], pet
+        )
+
+        assert sweep['error_percent'].shape == (3, 3)
+        for i, P in enumerate(pressures):
+            for j, D in enumerate(diameters):
+                single = compare_thick_vs_thin_wall(
+                    VesselGeometry(inner_diameter=D, wall_thickness=0.0003), P, pet
+                )
+                assert sweep['hoop_stress_thick_max'][i, j] == pytest.approx(
+                    single['hoop_stress_thick_max'])
+                assert sweep['error_percent'][i, j] == pytest.approx(
+                    single['error_percent'])
+
     def test_thick_wall_deviation(self):
         """Test that thick walls deviate from thin-wall theory."""
         # Moderately thick wall
@@ -16,7 +16,7 @@ from ..system_model.materials import MaterialProperties
 from ..system_model.burst_calculator import VesselGeometry
 
 
-@dataclass
+@dataclass(slots=True)
 class ThickWallResult:
     """
     Results from thick-wall cylinder analysis.
@@ -43,6 +43,23 @@ class ThickWallResult:
     epsilon_z: np.ndarray
 
 
+def _lame_constants(r_i, r_o, P_i, P_o):
+    """
+    Return the Lamé constants (A, B) and the closed-end axial stress.
+
+    Plain arithmetic on scalars or broadcastable arrays, shared by the full
+    through-thickness solution and the closed-form surface stresses:
+    σ_r = A - B/r², σ_θ = A + B/r², σ_z = P_i r_i² / (r_o² - r_i²).
+    """
+    # Squared radii computed once and shared
+    r_i2 = r_i * r_i
+    r_o2 = r_o * r_o
+    k = r_o2 - r_i2
+    A = (P_i * r_i2 - P_o * r_o2) / k
+    B = (P_i - P_o) * r_i2 * r_o2 / k
+    return A, B, P_i * r_i2 / k
+
+
 def solve_lame_equations(
     inner_radius: float,
     outer_radius: float,
@@ -61,11 +78,17 @@ def solve_lame_equations(
         For thick-wall cylinder (t/D > 0.1), stress varies through thickness.
         Lamé equations give exact solution for infinite cylinder.
 
+    Accepts a scalar pressure or a 1-D array of pressures (e.g. a pressure
+    time history). For an array of M pressures every load case is solved in
+    one vectorized pass: the stress, strain and displacement fields have
+    shape (M, n_points), one row per pressure, while ``r`` stays 1-D.
+
     Args:
         inner_radius: Inner radius r_i (m)
         outer_radius: Outer radius r_o (m)
-        internal_pressure: Internal pressure P_i (Pa)
-        external_pressure: External pressure P_o (Pa), default 0
+        internal_pressure: Internal pressure P_i (Pa), scalar or 1-D array
+        external_pressure: External pressure P_o (Pa), default 0, scalar or
+            1-D array matching internal_pressure
         material: Material properties (needed for displacement)
         n_points: Number of evaluation points through thickness
 
@@ -91,50 +114,53 @@ def solve_lame_equations(
     r_o = outer_radius
     P_i = internal_pressure
     P_o = external_pressure
+    if np.ndim(P_i) or np.ndim(P_o):
+        # One row per load case, broadcast against the radial positions
+        P_i = np.asarray(P_i, dtype=float)[..., np.newaxis]
+        P_o = np.asarray(P_o, dtype=float)[..., np.newaxis]
 
     # Constant terms
-    k = (r_o**2 - r_i**2)
-    A = (P_i * r_i**2 - P_o * r_o**2) / k
-    B = (P_i - P_o) * r_i**2 * r_o**2 / k
+    A, B, sigma_z = _lame_constants(r_i, r_o, P_i, P_o)
 
-    # Lamé equations for stress
-    # Radial stress: σ_r(r) = A - B/r²
-    sigma_r = A - B / r**2
+    # Lamé equations for stress; the B/r² term is shared by both
+    B_r2 = B / (r * r)
 
     # Hoop (circumferential) stress: σ_θ(r) = A + B/r²
-    sigma_theta = A + B / r**2
+    sigma_theta = A + B_r2
 
-    # Axial stress (for closed-end cylinder)
-    # Assuming plane strain or σ_z = constant
-    sigma_z = P_i * r_i**2 / (r_o**2 - r_i**2)
-    sigma_z_array = np.full_like(r, sigma_z)
+    # Radial stress: σ_r(r) = A - B/r² (written over the B/r² buffer)
+    sigma_r = np.subtract(A, B_r2, out=B_r2)
+
+    # Axial stress (for closed-end cylinder), uniform through the wall
+    sigma_z_array = np.full(sigma_r.shape, sigma_z)
 
     # Von Mises stress
     # σ_vm = √[(σ_r - σ_θ)² + (σ_θ - σ_z)² + (σ_z - σ_r)²] / √2
-    sigma_vm = np.sqrt(
-        ((sigma_r - sigma_theta)**2 +
-         (sigma_theta - sigma_z_array)**2 +
-         (sigma_z_array - sigma_r)**2) / 2
-    )
+    # σ_z is uniform, so it enters as a scalar; the three differences sum to
+    # zero, so the third is formed from the first two
+    d_r_theta = sigma_r - sigma_theta
+    d_theta_z = sigma_theta - sigma_z
+    d_z_r = -(d_r_theta + d_theta_z)
+    sigma_vm = np.sqrt((d_r_theta**2 + d_theta_z**2 + d_z_r**2) / 2)
 
     # Displacement and strain (if material properties provided)
     if material is not None:
-        E = material.elastic_modulus
+        inv_E = 1.0 / material.elastic_modulus  # Compliance, shared below
         nu = material.poisson_ratio
 
         # Radial displacement: u_r(r) = (1/E)[(1-ν)Ar + (1+ν)B/r]
-        u_r = (1/E) * ((1 - nu) * A * r + (1 + nu) * B / r)
+        u_r = inv_E * ((1 - nu) * A * r + (1 + nu) * B / r)
 
         # Strains
-        epsilon_r = (1/E) * (sigma_r - nu * (sigma_theta + sigma_z_array))
-        epsilon_theta = (1/E) * (sigma_theta - nu * (sigma_r + sigma_z_array))
-        epsilon_z = (1/E) * (sigma_z_array - nu * (sigma_r + sigma_theta))
+        epsilon_r = inv_E * (sigma_r - nu * (sigma_theta + sigma_z))
+        epsilon_theta = inv_E * (sigma_theta - nu * (sigma_r + sigma_z))
+        epsilon_z = inv_E * (sigma_z - nu * (sigma_r + sigma_theta))
     else:
         # No material properties - set to zero
-        u_r = np.zeros_like(r)
-        epsilon_r = np.zeros_like(r)
-        epsilon_theta = np.zeros_like(r)
-        epsilon_z = np.zeros_like(r)
+        u_r = np.zeros(sigma_r.shape)
+        epsilon_r = np.zeros(sigma_r.shape)
+        epsilon_theta = np.zeros(sigma_r.shape)
+        epsilon_z = np.zeros(sigma_r.shape)
 
     return ThickWallResult(
         r=r,
@@ -152,15 +178,23 @@ def solve_lame_equations(
 def compare_thick_vs_thin_wall(
     geometry: VesselGeometry,
     pressure: float,
-    material: MaterialProperties
+    material: MaterialProperties,
+    lame_result: Optional[ThickWallResult] = None
 ) -> Dict[str, float]:
     """
     Compare thick-wall (Lamé) vs thin-wall (Barlow) solutions.
 
+    Pressure and geometry dimensions may be arrays; they broadcast, so a
+    sweep is compared in one call (e.g. pressures of shape (N, 1) against
+    diameters of shape (1, M) give (N, M) metrics).
+
     Args:
         geometry: Vessel geometry
-        pressure: Internal pressure (Pa)
+        pressure: Internal pressure (Pa), scalar or array
         material: Material properties
+        lame_result: Lamé solution already computed for this geometry and
+            pressure (one row per pressure for an array of pressures).
+            If given, the equations are not solved again.
 
     Returns:
         Dictionary with comparison metrics:
@@ -178,19 +212,26 @@ def compare_thick_vs_thin_wall(
     r_o = r_i + t
 
     # Thickness ratio
-    thickness_ratio = t / geometry.inner_diameter
+    thickness_ratio = geometry.thickness_ratio
     thin_wall_valid = thickness_ratio < 0.1
 
     # Thin-wall solution (Module 2)
     sigma_thin = calculate_hoop_stress(pressure, geometry)
 
     # Thick-wall solution (Lamé)
-    result = solve_lame_equations(r_i, r_o, pressure, material=material)
-    sigma_thick_max = np.max(result.sigma_theta)
-    sigma_thick_inner = result.sigma_theta[0]  # Max occurs at inner surface
+    if lame_result is not None:
+        sigma_thick_max = np.max(lame_result.sigma_theta, axis=-1)
+        # Max occurs at inner surface (np.take keeps a scalar for one profile)
+        sigma_thick_inner = np.take(lame_result.sigma_theta, 0, axis=-1)
+    else:
+        # Only surface values are needed: σ_θ = A + B/r² is monotonic in r, so
+        # its extremes are the surface stresses
+        A, B, _ = _lame_constants(r_i, r_o, pressure, 0.0)
+        sigma_thick_inner = A + B / (r_i * r_i)
+        sigma_thick_max = np.maximum(sigma_thick_inner, A + B / (r_o * r_o))
 
     # Error in thin-wall approximation
-    error_percent = abs(sigma_thick_max - sigma_thin) / sigma_thick_max * 100
+    error_percent = np.abs(sigma_thick_max - sigma_thin) / sigma_thick_max * 100
 
     return {
         'thickness_ratio': thickness_ratio,
@@ -234,7 +275,9 @@ def calculate_thick_wall_burst_pressure(
     sigma_allow = material.yield_strength if use_yield else material.tensile_strength
 
     # Burst pressure from Lamé (maximum hoop stress at inner surface)
-    P_burst = sigma_allow * (r_o**2 - r_i**2) / (r_o**2 + r_i**2)
+    r_i2 = r_i**2
+    r_o2 = r_o**2
+    P_burst = sigma_allow * (r_o2 - r_i2) / (r_o2 + r_i2)
 
     return P_burst
 
@@ -264,25 +307,31 @@ def validate_lame_solution(
 
     # Check boundary conditions
     tol = 1e-6  # Relative tolerance
+    atol = 1e-8  # Absolute tolerance (np.isclose default)
+
+    # Single values, so the np.isclose test |a - b| <= atol + rtol*|b| is
+    # evaluated in plain float arithmetic (no ufunc dispatch per check)
 
     # σ_r(r_i) should equal -P_i
-    sigma_r_inner = result.sigma_r[0]
-    checks['bc_inner'] = np.isclose(sigma_r_inner, -inner_pressure, rtol=tol)
+    sigma_r_inner = float(result.sigma_r[0])
+    checks['bc_inner'] = (abs(sigma_r_inner + inner_pressure)
+                          <= atol + tol * abs(inner_pressure))
 
     # σ_r(r_o) should equal -P_o
-    sigma_r_outer = result.sigma_r[-1]
-    checks['bc_outer'] = np.isclose(sigma_r_outer, -outer_pressure, rtol=tol)
+    sigma_r_outer = float(result.sigma_r[-1])
+    checks['bc_outer'] = (abs(sigma_r_outer + outer_pressure)
+                          <= atol + tol * abs(outer_pressure))
 
     # Hoop stress should be maximum at inner surface (for P_i > P_o)
     if inner_pressure > outer_pressure:
         max_hoop_idx = np.argmax(result.sigma_theta)
-        checks['hoop_max_inner'] = (max_hoop_idx == 0)
+        checks['hoop_max_inner'] = bool(max_hoop_idx == 0)
     else:
         checks['hoop_max_inner'] = True
 
     # All hoop stresses should be positive for internal pressure
     if inner_pressure > 0 and outer_pressure == 0:
-        checks['hoop_positive'] = np.all(result.sigma_theta > 0)
+        checks['hoop_positive'] = bool(np.all(result.sigma_theta > 0))
     else:
         checks['hoop_positive'] = True
 
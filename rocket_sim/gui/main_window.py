@@ -185,13 +185,14 @@ class MainWindow(QMainWindow):
         self.plot_widget.display_results(result)
 
         # Show completion message
+        summary = result.summary
         if result.failed:
             QMessageBox.warning(
                 self,
                 "Simulation Complete - UNSAFE",
                 f"⚠️ FAILURE PREDICTED\n\n"
-                f"Peak Pressure: {result.summary['peak_pressure']/1e5:.2f} bar\n"
-                f"Safety Factor: {result.summary['min_safety_factor']:.2f}\n"
+                f"Peak Pressure: {summary['peak_pressure']/1e5:.2f} bar\n"
+                f"Safety Factor: {summary['min_safety_factor']:.2f}\n"
                 f"Failure Location: {result.failure_location}\n\n"
                 f"See results panel for details."
             )
@@ -200,9 +201,9 @@ class MainWindow(QMainWindow):
                 self,
                 "Simulation Complete - SAFE",
                 f"✅ SAFE CONFIGURATION\n\n"
-                f"Peak Pressure: {result.summary['peak_pressure']/1e5:.2f} bar\n"
-                f"Safety Factor: {result.summary['min_safety_factor']:.2f}\n"
-                f"Max Stress: {result.summary['max_von_mises_stress']/1e6:.1f} MPa\n\n"
+                f"Peak Pressure: {summary['peak_pressure']/1e5:.2f} bar\n"
+                f"Safety Factor: {summary['min_safety_factor']:.2f}\n"
+                f"Max Stress: {summary['max_von_mises_stress']/1e6:.1f} MPa\n\n"
                 f"Elapsed Time: {elapsed_time:.2f} s"
             )
 
@@ -303,16 +304,19 @@ class MainWindow(QMainWindow):
 
                 # Add configuration info
                 config = self.config_widget.get_config_dict()
-                header = "=" * 70 + "\n"
-                header += "PET ROCKET SIMULATOR - SIMULATION REPORT\n"
-                header += "=" * 70 + "\n\n"
-                header += f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-                header += "CONFIGURATION:\n"
-                header += f"  Volume:              {config['volume']*1000:.3f} L\n"
-                header += f"  H2:O2 Ratio:         {config['fuel_oxidizer_ratio']:.2f}\n"
-                header += f"  Vessel Diameter:     {config['vessel_diameter']*1000:.1f} mm\n"
-                header += f"  Vessel Thickness:    {config['vessel_thickness']*1000:.2f} mm\n"
-                header += f"  Vessel Material:     {config['vessel_material']}\n\n"
+                rule = "=" * 70
+                header = (
+                    f"{rule}\n"
+                    "PET ROCKET SIMULATOR - SIMULATION REPORT\n"
+                    f"{rule}\n\n"
+                    f"Timestamp: {datetime.now():%Y-%m-%d %H:%M:%S}\n\n"
+                    "CONFIGURATION:\n"
+                    f"  Volume:              {config['volume']*1000:.3f} L\n"
+                    f"  H2:O2 Ratio:         {config['fuel_oxidizer_ratio']:.2f}\n"
+                    f"  Vessel Diameter:     {config['vessel_diameter']*1000:.1f} mm\n"
+                    f"  Vessel Thickness:    {config['vessel_thickness']*1000:.2f} mm\n"
+                    f"  Vessel Material:     {config['vessel_material']}\n\n"
+                )
 
                 full_text = header + text
 
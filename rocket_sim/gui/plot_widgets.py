@@ -5,6 +5,7 @@ This module integrates Matplotlib with Qt to display
 simulation results as interactive plots.
 """
 
+import numpy as np
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QTabWidget, QMessageBox, QPushButton,
     QHBoxLayout, QFileDialog
@@ -14,14 +15,56 @@ from matplotlib.backends.backend_qtagg import (
     NavigationToolbar2QT as NavigationToolbar
 )
 from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
 
-from rocket_sim.visualization.plots import (
-    plot_pressure_temperature_time,
-    plot_stress_distribution,
-    plot_safety_factor_evolution,
-    create_comprehensive_dashboard
-)
+
+def _derive_plot_series(result):
+    """
+    Derive the plotted series shared by the tabs in a single pass.
+
+    Several tabs show the same quantities (time in ms, pressure in bar,
+    surface stresses in MPa); converting them once here keeps the tabs from
+    each re-deriving their own copies.
+
+    Args:
+        result: SimulationResult object from run_complete_simulation
+
+    Returns:
+        Dictionary of derived arrays; entries are None when the
+        corresponding part of the result is unavailable
+    """
+    series = {
+        'combustion_time_ms': None,
+        'pressure_bar': None,
+        'temperature': None,
+        'system_time_ms': None,
+        'safety_factor': None,
+        'hoop_inner_mpa': None,
+        'hoop_outer_mpa': None,
+        'axial_mpa': None,
+    }
+
+    combustion = getattr(result, 'combustion', None)
+    if combustion is not None:
+        series['combustion_time_ms'] = combustion.time * 1000
+        series['pressure_bar'] = combustion.pressure / 1e5
+        series['temperature'] = combustion.temperature
+
+    system = getattr(result, 'system', None)
+    if system is not None:
+        series['system_time_ms'] = system.time * 1000
+        series['safety_factor'] = system.safety_factor
+
+    fem = getattr(result, 'fem_analysis', None)
+    if fem is not None and 'lame_solution' in fem:
+        lame = fem['lame_solution']
+        # Inner surface is at index 0, outer at index -1
+        hoop = lame['sigma_hoop']
+        axial = lame['sigma_axial']
+        series['hoop_inner_mpa'] = hoop[0] / 1e6 if len(hoop) else 0
+        series['hoop_outer_mpa'] = hoop[-1] / 1e6 if len(hoop) else 0
+        series['axial_mpa'] = axial[0] / 1e6 if len(axial) else 0
+
+    return series
 
 
 class PlotCanvas(QWidget):
@@ -53,6 +96,9 @@ class VisualizationWidget(QWidget):
     def __init__(self, parent=None):
         """Initialize the visualization widget."""
         super().__init__(parent)
+        # Tabs are drawn on first view; indices here still need drawing
+        self._pending_tabs = set()
+        self._series = None
         self._init_ui()
         self.current_result = None
 
@@ -79,6 +125,8 @@ class VisualizationWidget(QWidget):
         self.dashboard_canvas = PlotCanvas()
         self.tabs.addTab(self.dashboard_canvas, "Dashboard (All)")
 
+        self.tabs.currentChanged.connect(self._render_tab)
+
         layout.addWidget(self.tabs)
 
         # Add control buttons
@@ -109,12 +157,36 @@ class VisualizationWidget(QWidget):
         self.current_result = result
 
         try:
-            # Generate all plots
-            self._plot_pressure_temperature(result)
-            self._plot_stress_distribution(result)
-            self._plot_safety_factor(result)
-            self._plot_dashboard(result)
+            # Derive shared series once; the tabs are plotted from them
+            self._series = _derive_plot_series(result)
+        except Exception as e:
+            QMessageBox.warning(
+                self,
+                "Plot Error",
+                f"Failed to generate plots:\n{str(e)}"
+            )
+            return
+
+        # Only the visible tab is drawn now, the rest when first selected
+        self._pending_tabs = set(range(self.tabs.count()))
+        self._render_tab(self.tabs.currentIndex())
+
+    def _render_tab(self, index):
+        """Draw the plot of tab ``index`` if it has not been drawn yet."""
+        if index not in self._pending_tabs:
+            return
+        self._pending_tabs.discard(index)
+
+        series = self._series
+        renderers = (
+            lambda: self._plot_pressure_temperature(series),
+            lambda: self._plot_stress_distribution(self.current_result, series),
+            lambda: self._plot_safety_factor(series),
+            lambda: self._plot_dashboard(series),
+        )
 
+        try:
+            renderers[index]()
         except Exception as e:
             QMessageBox.warning(
                 self,
@@ -122,7 +194,7 @@ class VisualizationWidget(QWidget):
                 f"Failed to generate plots:\n{str(e)}"
             )
 
-    def _plot_pressure_temperature(self, result):
+    def _plot_pressure_temperature(self, series):
         """Generate pressure & temperature vs time plot."""
         self.pressure_temp_canvas.figure.clear()
 
@@ -131,20 +203,19 @@ class VisualizationWidget(QWidget):
         ax1 = self.pressure_temp_canvas.figure.add_subplot(111)
         ax2 = ax1.twinx()
 
-        # Extract data from result
-        time = result.combustion.time
-        pressure = result.combustion.pressure / 1e5  # Convert to bar
-        temperature = result.combustion.temperature
+        time = series['combustion_time_ms']
+        pressure = series['pressure_bar']
+        temperature = series['temperature']
 
         # Plot pressure
-        ax1.plot(time * 1000, pressure, 'b-', linewidth=2, label='Pressure')
+        ax1.plot(time, pressure, 'b-', linewidth=2, label='Pressure')
         ax1.set_xlabel('Time (ms)', fontsize=12)
         ax1.set_ylabel('Pressure (bar)', color='b', fontsize=12)
         ax1.tick_params(axis='y', labelcolor='b')
         ax1.grid(True, alpha=0.3)
 
         # Plot temperature
-        ax2.plot(time * 1000, temperature, 'r-', linewidth=2, label='Temperature')
+        ax2.plot(time, temperature, 'r-', linewidth=2, label='Temperature')
         ax2.set_ylabel('Temperature (K)', color='r', fontsize=12)
         ax2.tick_params(axis='y', labelcolor='r')
 
@@ -158,7 +229,7 @@ class VisualizationWidget(QWidget):
         self.pressure_temp_canvas.figure.tight_layout()
         self.pressure_temp_canvas.canvas.draw()
 
-    def _plot_stress_distribution(self, result):
+    def _plot_stress_distribution(self, result, series):
         """Generate stress distribution plot."""
         self.stress_canvas.figure.clear()
 
@@ -166,28 +237,22 @@ class VisualizationWidget(QWidget):
         if hasattr(result, 'fem_analysis') and result.fem_analysis is not None:
             ax = self.stress_canvas.figure.add_subplot(111)
 
-            fem = result.fem_analysis
-
-            # Extract stress data from lame_solution
-            if 'lame_solution' in fem:
-                lame = fem['lame_solution']
-
-                # Get inner and outer surface stresses
-                # Inner surface is at index 0, outer at index -1
-                hoop_inner = lame['sigma_hoop'][0] / 1e6 if lame['sigma_hoop'] else 0
-                hoop_outer = lame['sigma_hoop'][-1] / 1e6 if lame['sigma_hoop'] else 0
-                axial_inner = lame['sigma_axial'][0] / 1e6 if lame['sigma_axial'] else 0
+            # Surface stresses from the Lamé solution
+            if series['hoop_inner_mpa'] is not None:
+                hoop_inner = series['hoop_inner_mpa']
+                hoop_outer = series['hoop_outer_mpa']
+                axial_inner = series['axial_mpa']
 
                 locations = ['Inner\nSurface', 'Outer\nSurface']
                 hoop_stresses = [hoop_inner, hoop_outer]
                 axial_stresses = [axial_inner, axial_inner]  # Axial is constant through thickness
 
-                x = range(len(locations))
+                x = np.arange(len(locations))
                 width = 0.35
 
-                ax.bar([i - width/2 for i in x], hoop_stresses, width,
+                ax.bar(x - width/2, hoop_stresses, width,
                        label='Hoop Stress', color='steelblue')
-                ax.bar([i + width/2 for i in x], axial_stresses, width,
+                ax.bar(x + width/2, axial_stresses, width,
                        label='Axial Stress', color='coral')
 
                 ax.set_ylabel('Stress (MPa)', fontsize=12)
@@ -215,16 +280,15 @@ class VisualizationWidget(QWidget):
 
         self.stress_canvas.canvas.draw()
 
-    def _plot_safety_factor(self, result):
+    def _plot_safety_factor(self, series):
         """Generate safety factor evolution plot."""
         self.safety_canvas.figure.clear()
 
-        if hasattr(result, 'system') and result.system is not None:
+        if series['system_time_ms'] is not None:
             ax = self.safety_canvas.figure.add_subplot(111)
 
-            dynamics = result.system
-            time = dynamics.time * 1000  # Convert to ms
-            safety_factor = dynamics.safety_factor
+            time = series['system_time_ms']
+            safety_factor = series['safety_factor']
 
             # Plot safety factor
             ax.plot(time, safety_factor, 'g-', linewidth=2, label='Safety Factor')
@@ -258,7 +322,7 @@ class VisualizationWidget(QWidget):
 
         self.safety_canvas.canvas.draw()
 
-    def _plot_dashboard(self, result):
+    def _plot_dashboard(self, series):
         """Generate comprehensive dashboard with all plots."""
         self.dashboard_canvas.figure.clear()
 
@@ -266,9 +330,9 @@ class VisualizationWidget(QWidget):
         axes = self.dashboard_canvas.figure.subplots(2, 2)
 
         # Plot 1: Pressure vs Time
-        if hasattr(result, 'combustion'):
-            time = result.combustion.time * 1000
-            pressure = result.combustion.pressure / 1e5
+        time = series['combustion_time_ms']
+        if time is not None:
+            pressure = series['pressure_bar']
             axes[0, 0].plot(time, pressure, 'b-', linewidth=2)
             axes[0, 0].set_xlabel('Time (ms)')
             axes[0, 0].set_ylabel('Pressure (bar)', color='b')
@@ -276,8 +340,8 @@ class VisualizationWidget(QWidget):
             axes[0, 0].grid(True, alpha=0.3)
 
         # Plot 2: Temperature vs Time
-        if hasattr(result, 'combustion'):
-            temperature = result.combustion.temperature
+        if time is not None:
+            temperature = series['temperature']
             axes[0, 1].plot(time, temperature, 'r-', linewidth=2)
             axes[0, 1].set_xlabel('Time (ms)')
             axes[0, 1].set_ylabel('Temperature (K)', color='r')
@@ -285,9 +349,9 @@ class VisualizationWidget(QWidget):
             axes[0, 1].grid(True, alpha=0.3)
 
         # Plot 3: Safety Factor
-        if hasattr(result, 'system') and result.system is not None:
-            dyn_time = result.system.time * 1000
-            sf = result.system.safety_factor
+        if series['system_time_ms'] is not None:
+            dyn_time = series['system_time_ms']
+            sf = series['safety_factor']
             axes[1, 0].plot(dyn_time, sf, 'g-', linewidth=2)
             axes[1, 0].axhline(y=1.0, color='r', linestyle='--', alpha=0.7)
             axes[1, 0].axhline(y=2.0, color='orange', linestyle='--', alpha=0.7)
@@ -298,19 +362,13 @@ class VisualizationWidget(QWidget):
             axes[1, 0].set_ylim(bottom=0)
 
         # Plot 4: Stress Summary
-        if hasattr(result, 'fem_analysis') and result.fem_analysis is not None:
-            fem = result.fem_analysis
-            if 'lame_solution' in fem:
-                lame = fem['lame_solution']
-                locations = ['Inner', 'Outer']
-                stresses = [
-                    lame['sigma_hoop'][0] / 1e6 if lame['sigma_hoop'] else 0,
-                    lame['sigma_hoop'][-1] / 1e6 if lame['sigma_hoop'] else 0
-                ]
-                axes[1, 1].bar(locations, stresses, color=['steelblue', 'coral'])
-                axes[1, 1].set_ylabel('Hoop Stress (MPa)')
-                axes[1, 1].set_title('Stress Distribution')
-                axes[1, 1].grid(True, alpha=0.3, axis='y')
+        if series['hoop_inner_mpa'] is not None:
+            locations = ['Inner', 'Outer']
+            stresses = [series['hoop_inner_mpa'], series['hoop_outer_mpa']]
+            axes[1, 1].bar(locations, stresses, color=['steelblue', 'coral'])
+            axes[1, 1].set_ylabel('Hoop Stress (MPa)')
+            axes[1, 1].set_title('Stress Distribution')
+            axes[1, 1].grid(True, alpha=0.3, axis='y')
 
         self.dashboard_canvas.figure.suptitle(
             'Comprehensive Simulation Dashboard',
@@ -360,7 +418,12 @@ class VisualizationWidget(QWidget):
 
         if filename:
             try:
-                canvas.figure.savefig(filename, dpi=300, bbox_inches='tight')
+                kwargs = {}
+                if filename.lower().endswith('.png'):
+                    # Fast deflate; the larger file is worth the quicker save
+                    kwargs['pil_kwargs'] = {'compress_level': 1}
+                canvas.figure.savefig(filename, dpi=300, bbox_inches='tight',
+                                      **kwargs)
                 QMessageBox.information(
                     self,
                     "Success",
@@ -379,4 +442,6 @@ class VisualizationWidget(QWidget):
         self.stress_canvas.clear()
         self.safety_canvas.clear()
         self.dashboard_canvas.clear()
+        self._pending_tabs.clear()
+        self._series = None
         self.current_result = None
@@ -11,8 +11,10 @@ Requirements: FR-1 through FR-9 (complete system)
 """
 
 import numpy as np
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from typing import Dict, Optional, Any
+import io
+import sys
 import time
 import warnings
 
@@ -26,7 +28,7 @@ from ..system_model import (
 )
 from ..fem import (
     solve_lame_equations,
-    calculate_maximum_stress,
+    calculate_maximum_stress_state,
     estimate_failure_location,
     compare_thick_vs_thin_wall,
 )
@@ -88,10 +90,16 @@ class FullSimulationConfig:
 
     def to_dict(self) -> Dict[str, Any]:
         """Export configuration to dictionary."""
-        return asdict(self)
+        # Every field is a scalar, so a shallow copy is all that is needed;
+        # asdict() would deep-copy each value recursively
+        return {name: getattr(self, name) for name in _CONFIG_FIELD_NAMES}
 
 
-@dataclass
+# Field names of FullSimulationConfig, in declaration order
+_CONFIG_FIELD_NAMES = tuple(f.name for f in fields(FullSimulationConfig))
+
+
+@dataclass(slots=True)
 class FullSimulationResult:
     """
     Complete simulation results from all three modules.
@@ -121,11 +129,19 @@ class FullSimulationResult:
 
     def to_dict(self) -> Dict[str, Any]:
         """Export full results to dictionary for JSON serialization."""
+        # Lamé profiles are kept as arrays; convert them only for export
+        fem_analysis = dict(self.fem_analysis)
+        if 'lame_solution' in fem_analysis:
+            fem_analysis['lame_solution'] = {
+                key: value.tolist() if isinstance(value, np.ndarray) else value
+                for key, value in fem_analysis['lame_solution'].items()
+            }
+
         return {
             'config': self.config.to_dict(),
             'combustion': self.combustion.to_dict(),
             'system': self.system.to_dict() if hasattr(self.system, 'to_dict') else {},
-            'fem_analysis': self.fem_analysis,
+            'fem_analysis': fem_analysis,
             'summary': self.summary,
             'warnings': self.warnings,
             'execution_time': self.execution_time,
@@ -171,12 +187,14 @@ def run_complete_simulation(config: FullSimulationConfig, verbose: bool = True)
     warnings_list = []
 
     if verbose:
-        print("=" * 70)
-        print("PET ROCKET SIMULATOR - Full System Analysis")
-        print("=" * 70)
-        print(f"Configuration: {config.volume*1000:.1f}L, MR={config.fuel_oxidizer_ratio:.1f}, "
-              f"Material={config.vessel_material}")
-        print()
+        rule = "=" * 70
+        print(
+            f"{rule}\n"
+            "PET ROCKET SIMULATOR - Full System Analysis\n"
+            f"{rule}\n"
+            f"Configuration: {config.volume*1000:.1f}L, MR={config.fuel_oxidizer_ratio:.1f}, "
+            f"Material={config.vessel_material}\n"
+        )
 
     # Step 1: Module 1 - Combustion simulation
     if verbose:
@@ -215,12 +233,17 @@ def run_complete_simulation(config: FullSimulationConfig, verbose: bool = True)
         failure_criterion=config.failure_criterion
     )
 
-    # Run system simulation (M1→M2 integration)
-    _, system_result = run_system_simulation(sys_config)
+    # Run system simulation (M1→M2 integration), reusing the combustion
+    # result from step 1 instead of running Cantera a second time
+    _, system_result = run_system_simulation(sys_config, combustion_result=combustion_result)
+
+    # Reduce the time histories once; these scalars feed FEM, report and summary
+    P_max = np.max(system_result.pressure)
+    min_SF = np.min(system_result.safety_factor)
 
     if verbose:
-        print(f"      Peak system pressure: {np.max(system_result.pressure)/1e5:.2f} bar")
-        print(f"      Min safety factor: {np.min(system_result.safety_factor):.2f}")
+        print(f"      Peak system pressure: {P_max/1e5:.2f} bar")
+        print(f"      Min safety factor: {min_SF:.2f}")
         if system_result.failed:
             print(f"      ⚠️  VESSEL FAILED at t={system_result.failure_time:.6f} s")
 
@@ -236,9 +259,6 @@ def run_complete_simulation(config: FullSimulationConfig, verbose: bool = True)
     )
     material = get_material(config.vessel_material)
 
-    # Peak pressure for FEM analysis
-    P_max = np.max(system_result.pressure)
-
     # Thick-wall analysis (Lamé equations)
     r_i = config.vessel_diameter / 2
     r_o = r_i + config.vessel_thickness
@@ -251,11 +271,12 @@ def run_complete_simulation(config: FullSimulationConfig, verbose: bool = True)
         n_points=config.n_points_fem
     )
 
-    # Thick vs thin-wall comparison
-    comparison = compare_thick_vs_thin_wall(geometry, P_max, material)
+    # Thick vs thin-wall comparison (reuses the Lamé solution above)
+    comparison = compare_thick_vs_thin_wall(geometry, P_max, material,
+                                            lame_result=lame_result)
 
     # Stress concentrations
-    stress_concentration_result = calculate_maximum_stress(
+    stress_concentration = calculate_maximum_stress_state(
         pressure=P_max,
         geometry=geometry,
         material=material,
@@ -267,50 +288,62 @@ def run_complete_simulation(config: FullSimulationConfig, verbose: bool = True)
     # Failure location prediction
     failure_loc = estimate_failure_location(P_max, geometry, config.cap_type)
 
+    max_hoop = np.max(lame_result.sigma_theta)
+    max_vm = np.max(lame_result.sigma_vm)
+
+    # Fields reused below for the summary, warnings and report
+    K_total = stress_concentration.K_total
+    sigma_max_concentrated = stress_concentration.sigma_max
+    critical_location = stress_concentration.location
+    thickness_ratio = comparison['thickness_ratio']
+    thin_wall_error = comparison['error_percent']
+
     if verbose:
         print(f"      Max hoop stress (inner): {lame_result.sigma_theta[0]/1e6:.1f} MPa")
-        print(f"      Max von Mises stress: {np.max(lame_result.sigma_vm)/1e6:.1f} MPa")
-        print(f"      Stress concentration factor: {stress_concentration_result['K_total']:.2f}")
-        print(f"      Critical location: {stress_concentration_result['location']}")
-        print(f"      Thin-wall error: {comparison['error_percent']:.2f}%")
+        print(f"      Max von Mises stress: {max_vm/1e6:.1f} MPa")
+        print(f"      Stress concentration factor: {K_total:.2f}")
+        print(f"      Critical location: {critical_location}")
+        print(f"      Thin-wall error: {thin_wall_error:.2f}%")
 
     # Compile FEM results
     fem_analysis = {
         'lame_solution': {
-            'r': lame_result.r.tolist(),
-            'sigma_hoop': lame_result.sigma_theta.tolist(),
-            'sigma_radial': lame_result.sigma_r.tolist(),
-            'sigma_axial': lame_result.sigma_z.tolist(),
-            'sigma_vm': lame_result.sigma_vm.tolist(),
-            'displacement': lame_result.u_r.tolist(),
+            'r': lame_result.r,
+            'sigma_hoop': lame_result.sigma_theta,
+            'sigma_radial': lame_result.sigma_r,
+            'sigma_axial': lame_result.sigma_z,
+            'sigma_vm': lame_result.sigma_vm,
+            'displacement': lame_result.u_r,
         },
         'thick_vs_thin': comparison,
-        'stress_concentrations': stress_concentration_result,
+        'stress_concentrations': stress_concentration._asdict(),
         'failure_location_predicted': failure_loc,
     }
 
     # Calculate summary statistics
+    SF_concentrated = material.yield_strength / sigma_max_concentrated
+
     summary = {
-        'peak_pressure': np.max(system_result.pressure),
+        'peak_pressure': P_max,
         'peak_temperature': np.max(system_result.temperature),
         'max_dPdt': combustion_result.max_dPdt,
-        'min_safety_factor': np.min(system_result.safety_factor),
-        'max_hoop_stress': np.max(lame_result.sigma_theta),
-        'max_von_mises_stress': np.max(lame_result.sigma_vm),
-        'stress_concentration_factor': stress_concentration_result['K_total'],
-        'max_stress_with_concentration': stress_concentration_result['sigma_max'],
-        'safety_factor_with_concentration': material.yield_strength / stress_concentration_result['sigma_max'],
+        'min_safety_factor': min_SF,
+        'max_hoop_stress': max_hoop,
+        'max_von_mises_stress': max_vm,
+        'stress_concentration_factor': K_total,
+        'max_stress_with_concentration': sigma_max_concentrated,
+        'safety_factor_with_concentration': SF_concentrated,
     }
 
     # Determine overall failure status
-    failed = system_result.failed or (summary['safety_factor_with_concentration'] < 1.0)
-    failure_location = stress_concentration_result['location'] if failed else None
-    safety_margin = min(summary['min_safety_factor'], summary['safety_factor_with_concentration'])
+    failed = system_result.failed or (SF_concentrated < 1.0)
+    failure_location = critical_location if failed else None
+    safety_margin = min(min_SF, SF_concentrated)
 
     # Check for warnings
-    if comparison['thickness_ratio'] > 0.05:
-        warnings_list.append(f"Thick wall (t/D={comparison['thickness_ratio']:.3f}): "
-                           f"thin-wall error {comparison['error_percent']:.1f}%")
+    if thickness_ratio > 0.05:
+        warnings_list.append(f"Thick wall (t/D={thickness_ratio:.3f}): "
+                           f"thin-wall error {thin_wall_error:.1f}%")
 
     if config.cap_type == "flat":
         warnings_list.append("Flat end cap has high stress concentration (K=2.5)")
@@ -324,22 +357,25 @@ def run_complete_simulation(config: FullSimulationConfig, verbose: bool = True)
     execution_time = time.time() - start_time
 
     if verbose:
-        print("\n" + "=" * 70)
-        print("SIMULATION COMPLETE")
-        print("=" * 70)
-        print(f"Execution time: {execution_time:.2f} seconds")
-        print(f"\nSUMMARY:")
-        print(f"  Peak Pressure: {summary['peak_pressure']/1e5:.2f} bar")
-        print(f"  Peak Temperature: {summary['peak_temperature']:.0f} K")
-        print(f"  Min Safety Factor: {summary['min_safety_factor']:.2f}")
-        print(f"  Safety Factor (w/ concentrations): {summary['safety_factor_with_concentration']:.2f}")
-        print(f"  Vessel Status: {'❌ FAILED' if failed else '✅ Safe'}")
+        # Assemble the final report in memory and write it in one go
+        report = io.StringIO()
+        print("\n" + "=" * 70, file=report)
+        print("SIMULATION COMPLETE", file=report)
+        print("=" * 70, file=report)
+        print(f"Execution time: {execution_time:.2f} seconds", file=report)
+        print(f"\nSUMMARY:", file=report)
+        print(f"  Peak Pressure: {P_max/1e5:.2f} bar", file=report)
+        print(f"  Peak Temperature: {summary['peak_temperature']:.0f} K", file=report)
+        print(f"  Min Safety Factor: {min_SF:.2f}", file=report)
+        print(f"  Safety Factor (w/ concentrations): {SF_concentrated:.2f}", file=report)
+        print(f"  Vessel Status: {'❌ FAILED' if failed else '✅ Safe'}", file=report)
         if failed:
-            print(f"  Failure Location: {failure_location}")
-        print(f"\nWARNINGS: {len(warnings_list)}")
+            print(f"  Failure Location: {failure_location}", file=report)
+        print(f"\nWARNINGS: {len(warnings_list)}", file=report)
         for w in warnings_list:
-            print(f"  - {w}")
-        print("=" * 70)
+            print(f"  - {w}", file=report)
+        print("=" * 70, file=report)
+        sys.stdout.write(report.getvalue())
 
     return FullSimulationResult(
         config=config,
@@ -356,7 +392,8 @@ def run_complete_simulation(config: FullSimulationConfig, verbose: bool = True)
 
 
 # Demonstration
-if __name__ == "__main__":
+def _demo():
+    """Run the safe and dangerous bottle examples."""
     print("\n=== Full System Integration Demo ===\n")
 
     # Example 1: Safe configuration (hemispherical cap)
@@ -394,3 +431,25 @@ if __name__ == "__main__":
     )
 
     result_dangerous = run_complete_simulation(config_dangerous, verbose=True)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Full system integration demo")
+    parser.add_argument("--profile", action="store_true",
+                        help="Profile the demo with cProfile and print the top 25 "
+                             "functions by cumulative time")
+    args = parser.parse_args()
+
+    if args.profile:
+        import cProfile
+        import pstats
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        _demo()
+        profiler.disable()
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(25)
+    else:
+        _demo()
@@ -17,11 +17,13 @@ from .materials import (
     get_material,
     list_available_materials,
     get_bottle_material,
+    get_material_table,
 )
 
 from .burst_calculator import (
     VesselGeometry,
     StressState,
+    FailureCheck,
     calculate_hoop_stress,
     calculate_axial_stress,
     calculate_von_mises_stress,
@@ -30,6 +32,8 @@ from .burst_calculator import (
     calculate_safety_factor,
     check_failure,
     predict_failure_pressure,
+    DESIGN_SPACE_DTYPE,
+    sweep_design_space,
 )
 
 from .ode_solver import (
@@ -41,6 +45,7 @@ from .system_integrator import (
     SimulationConfig,
     run_full_simulation,
     run_parametric_study,
+    summarize_parametric_study,
     estimate_safe_operating_pressure,
 )
 
@@ -50,9 +55,11 @@ __all__ = [
     "get_material",
     "list_available_materials",
     "get_bottle_material",
+    "get_material_table",
     # Burst calculator
     "VesselGeometry",
     "StressState",
+    "FailureCheck",
     "calculate_hoop_stress",
     "calculate_axial_stress",
     "calculate_von_mises_stress",
@@ -61,6 +68,8 @@ __all__ = [
     "calculate_safety_factor",
     "check_failure",
     "predict_failure_pressure",
+    "DESIGN_SPACE_DTYPE",
+    "sweep_design_space",
     # ODE solver
     "SystemState",
     "simulate_system_dynamics",
@@ -68,5 +77,6 @@ __all__ = [
     "SimulationConfig",
     "run_full_simulation",
     "run_parametric_study",
+    "summarize_parametric_study",
     "estimate_safe_operating_pressure",
 ]
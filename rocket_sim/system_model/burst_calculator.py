@@ -11,30 +11,58 @@ ISO/IEC/IEEE 12207:2017 - Implementation Process
 Requirements: FR-3 (Analytical burst calculator), NFR-9 (Safety warnings)
 """
 
+import math
 import numpy as np
-from dataclasses import dataclass
-from typing import Tuple, Optional
+from dataclasses import dataclass, field
+from typing import NamedTuple, Optional
 import warnings
 
 from .materials import MaterialProperties, get_material
 
 
-@dataclass
+# Von Mises stress of a closed thin-wall cylinder per unit membrane term P·D/t
+_VON_MISES_THIN_WALL = np.sqrt(3.0) / 4.0
+
+
+@dataclass(frozen=True, slots=True)
 class VesselGeometry:
     """
     Cylindrical pressure vessel geometry.
 
+    Immutable, so a geometry can be shared between runs; use
+    dataclasses.replace() to derive variants. Scalar geometries are also
+    hashable and can be used as cache keys. Array geometries (sweeps) are
+    not hashable, and comparing them with == is ambiguous.
+
     Attributes:
         inner_diameter: Inner diameter (m)
         wall_thickness: Wall thickness (m)
         length: Cylindrical length (m), optional for stress calculations
+        thickness_ratio: Wall thickness to diameter ratio t/D, derived
+            once at construction (element-wise for array geometries)
+        cross_section_area: Inner cross-section area πD²/4 (m²), derived
+        internal_volume: Cylindrical internal volume (m³), derived;
+            None when length is not given
     """
     inner_diameter: float  # m
     wall_thickness: float  # m
     length: Optional[float] = None  # m
-
-
-@dataclass
+    thickness_ratio: float = field(init=False, repr=False, compare=False)
+    cross_section_area: float = field(init=False, repr=False, compare=False)
+    internal_volume: Optional[float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        ratio = self.wall_thickness / np.asarray(self.inner_diameter)
+        area = self.inner_diameter**2 * np.pi / 4
+        # Frozen, so the derived fields are set through object.__setattr__
+        object.__setattr__(self, 'thickness_ratio',
+                           ratio if ratio.ndim else float(ratio))
+        object.__setattr__(self, 'cross_section_area', area)
+        object.__setattr__(self, 'internal_volume',
+                           None if self.length is None else area * self.length)
+
+
+@dataclass(slots=True)
 class StressState:
     """
     Stress state in a pressure vessel.
@@ -51,6 +79,21 @@ class StressState:
     von_mises_stress: float # Pa
 
 
+class FailureCheck(NamedTuple):
+    """
+    Result of a failure check.
+
+    A plain tuple underneath, so it still unpacks as
+    ``failed, SF = check_failure(...)``.
+
+    Attributes:
+        failed: True where the safety factor is below 1
+        safety_factor: Safety factor (dimensionless)
+    """
+    failed: bool
+    safety_factor: float
+
+
 def validate_thin_wall_assumption(geometry: VesselGeometry,
                                    threshold: float = 0.1) -> None:
     """
@@ -58,6 +101,10 @@ def validate_thin_wall_assumption(geometry: VesselGeometry,
 
     Thin-wall assumption valid when: t/D < 0.1
 
+    Diameter and thickness may be arrays (a design sweep); the check then
+    applies to the thickest-walled design, so one call covers the sweep and
+    the stress functions broadcast over the geometry arrays.
+
     Args:
         geometry: Vessel geometry
         threshold: Maximum thickness/diameter ratio (default 0.1)
@@ -68,7 +115,9 @@ def validate_thin_wall_assumption(geometry: VesselGeometry,
     Warning:
         Issues warning if ratio > 0.05 (marginal)
     """
-    ratio = geometry.wall_thickness / geometry.inner_diameter
+    ratio = geometry.thickness_ratio
+    if isinstance(ratio, np.ndarray):
+        ratio = float(np.max(ratio))
 
     if ratio > threshold:
         raise ValueError(
@@ -170,13 +219,25 @@ def calculate_von_mises_stress(hoop_stress: float,
     sigma_3 = radial_stress
 
     # Von Mises formula
-    sigma_vm = np.sqrt(
-        ((sigma_1 - sigma_2)**2 +
-         (sigma_2 - sigma_3)**2 +
-         (sigma_3 - sigma_1)**2) / 2
-    )
+    mean_square = ((sigma_1 - sigma_2)**2 +
+                   (sigma_2 - sigma_3)**2 +
+                   (sigma_3 - sigma_1)**2) / 2
+
+    # Scalars take math.sqrt, which skips NumPy's ufunc dispatch
+    if isinstance(mean_square, float):
+        return math.sqrt(mean_square)
+    return np.sqrt(mean_square)
+
 
-    return sigma_vm
+def _membrane_stress(pressure: float, geometry: VesselGeometry) -> float:
+    """
+    Return the thin-wall membrane term P·D/t (Pa).
+
+    Every thin-wall stress is a fixed multiple of this term, so one pass
+    over the pressure suffices (cheap for pressure histories). The caller
+    is responsible for validating the thin-wall assumption.
+    """
+    return pressure * (geometry.inner_diameter / geometry.wall_thickness)
 
 
 def calculate_stress_state(pressure: float,
@@ -197,10 +258,27 @@ def calculate_stress_state(pressure: float,
         >>> print(f"Hoop: {state.hoop_stress/1e6:.1f} MPa")
         >>> print(f"Von Mises: {state.von_mises_stress/1e6:.1f} MPa")
     """
-    sigma_hoop = calculate_hoop_stress(pressure, geometry)
-    sigma_axial = calculate_axial_stress(pressure, geometry)
+    validate_thin_wall_assumption(geometry)
+
+    return _thin_wall_stress_state(pressure, geometry)
+
+
+def _thin_wall_stress_state(pressure: float,
+                            geometry: VesselGeometry) -> StressState:
+    """
+    Calculate the thin-wall stress state without validating the geometry.
+
+    Kernel of calculate_stress_state for callers that have already run
+    validate_thin_wall_assumption on the geometry, so repeated evaluations
+    for the same vessel do not repeat the check.
+    """
+    membrane = _membrane_stress(pressure, geometry)
+
+    sigma_hoop = 0.5 * membrane       # P·D/(2t)
+    sigma_axial = 0.25 * membrane     # P·D/(4t)
     sigma_radial = 0.0  # Thin-wall assumption
-    sigma_vm = calculate_von_mises_stress(sigma_hoop, sigma_axial, sigma_radial)
+    # Von Mises with σ_axial = σ_hoop/2 and σ_radial = 0 reduces to √3/4 · |P|·D/t
+    sigma_vm = _VON_MISES_THIN_WALL * np.abs(membrane)
 
     return StressState(
         hoop_stress=sigma_hoop,
@@ -261,23 +339,39 @@ def calculate_burst_pressure(geometry: VesselGeometry,
     return P_burst_safe
 
 
+def _allowable_stress(material: MaterialProperties, criterion: str) -> float:
+    """Return the allowable stress (Pa) for a "yield" or "ultimate" criterion."""
+    if criterion.lower() == "yield":
+        return material.yield_strength
+    elif criterion.lower() == "ultimate":
+        return material.tensile_strength
+    raise ValueError(f"Unknown criterion '{criterion}'. Use 'yield' or 'ultimate'.")
+
+
 def calculate_safety_factor(pressure: float,
                             geometry: VesselGeometry,
                             material: MaterialProperties,
-                            criterion: str = "yield") -> float:
+                            criterion: str = "yield",
+                            stress_state: Optional[StressState] = None) -> float:
     """
     Calculate safety factor against failure.
 
     SF = σ_allowable / σ_actual
 
+    Accepts a scalar pressure or an array of pressures; an array (e.g. a
+    pressure sweep or time history) is evaluated in a single vectorized
+    pass and returns an array of safety factors.
+
     Args:
-        pressure: Current internal pressure (Pa)
+        pressure: Current internal pressure (Pa), scalar or array
         geometry: Vessel geometry
         material: Material properties
         criterion: "yield" or "ultimate" failure criterion
+        stress_state: Stress state already computed for ``pressure`` by
+            the caller; reused instead of being recalculated if given
 
     Returns:
-        Safety factor (dimensionless)
+        Safety factor (dimensionless), same shape as pressure
         SF > 1: Safe
         SF = 1: At failure threshold
         SF < 1: Failed
@@ -289,19 +383,23 @@ def calculate_safety_factor(pressure: float,
         >>> print(f"Safety factor: {SF:.2f}")
         Safety factor: 1.94
     """
-    # Calculate actual stress state
-    stress_state = calculate_stress_state(pressure, geometry)
-    sigma_actual = stress_state.von_mises_stress
+    # Actual von Mises stress; only that component is needed, so it is
+    # taken straight from the membrane term (its magnitude: external
+    # pressure loads the wall too) unless the caller has a state
+    if stress_state is None:
+        validate_thin_wall_assumption(geometry)
+        sigma_actual = _VON_MISES_THIN_WALL * np.abs(_membrane_stress(pressure, geometry))
+    else:
+        sigma_actual = stress_state.von_mises_stress
 
     # Get allowable stress
-    if criterion.lower() == "yield":
-        sigma_allow = material.yield_strength
-    elif criterion.lower() == "ultimate":
-        sigma_allow = material.tensile_strength
-    else:
-        raise ValueError(f"Unknown criterion '{criterion}'. Use 'yield' or 'ultimate'.")
+    sigma_allow = _allowable_stress(material, criterion)
+
+    # Safety factor (infinite when the vessel is unloaded)
+    if np.ndim(sigma_actual) > 0:
+        with np.errstate(divide='ignore'):
+            return np.where(sigma_actual > 0, sigma_allow / sigma_actual, np.inf)
 
-    # Safety factor
     if sigma_actual > 0:
         SF = sigma_allow / sigma_actual
     else:
@@ -313,18 +411,19 @@ def calculate_safety_factor(pressure: float,
 def check_failure(pressure: float,
                  geometry: VesselGeometry,
                  material: MaterialProperties,
-                 criterion: str = "yield") -> Tuple[bool, float]:
+                 criterion: str = "yield") -> FailureCheck:
     """
     Check if vessel has failed under given pressure.
 
     Args:
-        pressure: Internal pressure (Pa)
+        pressure: Internal pressure (Pa), scalar or array
         geometry: Vessel geometry
         material: Material properties
         criterion: "yield" (conservative) or "ultimate" (catastrophic)
 
     Returns:
-        (failed: bool, safety_factor: float)
+        FailureCheck(failed, safety_factor), element-wise arrays
+        for array input
 
     Example:
         >>> geom = VesselGeometry(inner_diameter=0.085, wall_thickness=0.0003)
@@ -336,7 +435,7 @@ def check_failure(pressure: float,
     SF = calculate_safety_factor(pressure, geometry, material, criterion)
     failed = (SF < 1.0)
 
-    return failed, SF
+    return FailureCheck(failed, SF)
 
 
 def predict_failure_pressure(geometry: VesselGeometry,
@@ -359,8 +458,79 @@ def predict_failure_pressure(geometry: VesselGeometry,
     return calculate_burst_pressure(geometry, material, use_yield, safety_factor=1.0)
 
 
+# Record layout of the grid returned by sweep_design_space: packed float64
+# fields, so a grid can also be viewed as a plain (N, M, 5) float64 array
+DESIGN_SPACE_DTYPE = np.dtype([
+    ("hoop_stress", np.float64),
+    ("axial_stress", np.float64),
+    ("von_mises_stress", np.float64),
+    ("safety_factor", np.float64),
+    ("burst_pressure", np.float64),
+])
+
+
+def sweep_design_space(inner_diameter: float,
+                       wall_thicknesses: np.ndarray,
+                       pressures: np.ndarray,
+                       material: MaterialProperties,
+                       criterion: str = "yield") -> np.ndarray:
+    """
+    Evaluate stresses and safety factors on a thickness × pressure grid.
+
+    Thicknesses are laid along the first axis and pressures along the
+    second, so the whole grid is computed with a handful of broadcast
+    array operations instead of one VesselGeometry per grid point.
+
+    Args:
+        inner_diameter: Inner diameter (m)
+        wall_thicknesses: Wall thicknesses to scan (m), length N
+        pressures: Internal pressures to scan (Pa), length M
+        material: Material properties
+        criterion: "yield" or "ultimate" failure criterion
+
+    Returns:
+        C-contiguous structured array of shape (N, M) and dtype
+        DESIGN_SPACE_DTYPE, with fields hoop_stress, axial_stress,
+        von_mises_stress, safety_factor (Pa, Pa, Pa, -) and
+        burst_pressure (Pa). ``grid.view((np.float64, 5))`` gives the
+        same memory as an (N, M, 5) float64 array without copying.
+
+    Raises:
+        ValueError: If any thickness violates the thin-wall assumption
+
+    Example:
+        >>> grid = sweep_design_space(0.095, np.linspace(2e-4, 6e-4, 5),
+        ...                           np.linspace(1e5, 1e6, 10), pet)
+        >>> safe = grid["safety_factor"] >= 2.0
+    """
+    thicknesses = np.asarray(wall_thicknesses, dtype=float)[:, np.newaxis]
+    pressures = np.asarray(pressures, dtype=float)[np.newaxis, :]
+    geometry = VesselGeometry(inner_diameter=inner_diameter,
+                              wall_thickness=thicknesses)
+    validate_thin_wall_assumption(geometry)
+
+    sigma_allow = _allowable_stress(material, criterion)
+    membrane = _membrane_stress(pressures, geometry)
+
+    # Each field is written in place (out=) rather than through a temporary
+    grid = np.empty(membrane.shape, dtype=DESIGN_SPACE_DTYPE)
+    np.multiply(membrane, 0.5, out=grid["hoop_stress"])
+    np.multiply(membrane, 0.25, out=grid["axial_stress"])
+    # Von Mises stress is a magnitude (external pressure loads the wall too)
+    von_mises = np.abs(membrane, out=grid["von_mises_stress"])
+    von_mises *= _VON_MISES_THIN_WALL
+    # Unloaded points keep SF = inf; the rest are divided in one masked pass
+    safety_factor = grid["safety_factor"]
+    safety_factor.fill(np.inf)
+    np.divide(sigma_allow, von_mises, out=safety_factor, where=von_mises > 0)
+    grid["burst_pressure"] = 2 * sigma_allow * thicknesses / inner_diameter
+
+    return grid
+
+
 # Demonstration code
 if __name__ == "__main__":
+    import sys
     from .materials import get_material
 
     print("=== Pressure Vessel Burst Calculator ===\n")
@@ -391,19 +561,21 @@ if __name__ == "__main__":
     print(f"Burst pressure (ultimate): {P_burst_ultimate/1e5:.1f} bar ({P_burst_ultimate/1e3:.0f} kPa)")
     print()
 
-    # Test at various pressures
-    test_pressures = [100e3, 300e3, 500e3, 800e3]  # kPa
+    # Test at various pressures (evaluated as one batch)
+    test_pressures = np.array([100e3, 300e3, 500e3, 800e3])  # Pa
+
+    stress_states = calculate_stress_state(test_pressures, bottle)
+    failed, safety_factors = check_failure(test_pressures, bottle, pet, criterion="yield")
 
     print("Safety factors at different pressures:")
     print("-" * 50)
-    for P in test_pressures:
-        SF = calculate_safety_factor(P, bottle, pet, criterion="yield")
-        stress_state = calculate_stress_state(P, bottle)
-        failed, _ = check_failure(P, bottle, pet, criterion="yield")
-
-        status = "❌ FAILED" if failed else "✅ Safe"
-        print(f"P = {P/1e3:4.0f} kPa: SF = {SF:.2f} | "
-              f"σ_vm = {stress_state.von_mises_stress/1e6:5.1f} MPa | {status}")
+    table = np.empty((len(test_pressures), 4), dtype=object)
+    table[:, 0] = test_pressures / 1e3
+    table[:, 1] = safety_factors
+    table[:, 2] = stress_states.von_mises_stress / 1e6
+    table[:, 3] = np.where(failed, "❌ FAILED", "✅ Safe")
+    np.savetxt(sys.stdout, table,
+               fmt="P = %4.0f kPa: SF = %.2f | σ_vm = %5.1f MPa | %s")
 
     print("\n" + "=" * 50)
     print("\n⚠️  WARNING: This is a simplified analytical model.")
@@ -9,10 +9,14 @@ Requirements: FR-3 (Analytical burst calculator), NFR-9 (Safety warnings)
 """
 
 from dataclasses import dataclass
-from typing import Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional, Tuple
 
+import numpy as np
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class MaterialProperties:
     """
     Material properties for structural analysis.
@@ -26,6 +30,10 @@ class MaterialProperties:
         density: Material density (kg/m³)
         max_temperature: Maximum service temperature (K)
         source: Reference for material properties
+
+    Note:
+        Instances are immutable: ``get_material`` hands out the shared
+        database entries, so a caller cannot alter them for everyone else.
     """
     name: str
     yield_strength: float      # Pa
@@ -37,9 +45,9 @@ class MaterialProperties:
     source: str
 
 
-# Material database
+# Material database (read-only; use get_material to look entries up)
 # Values are conservative estimates from literature
-MATERIALS: Dict[str, MaterialProperties] = {
+MATERIALS: Mapping[str, MaterialProperties] = MappingProxyType({
     "PET": MaterialProperties(
         name="Polyethylene Terephthalate (PET)",
         yield_strength=55e6,        # 55 MPa (conservative)
@@ -94,13 +102,55 @@ MATERIALS: Dict[str, MaterialProperties] = {
         max_temperature=923.15,     # 650°C (continuous service)
         source="ASTM A240 specification"
     ),
+})
+
+# Case-insensitive index into MATERIALS, built once at import
+_MATERIALS_BY_LOWER_NAME: Dict[str, MaterialProperties] = {
+    key.lower(): material for key, material in MATERIALS.items()
 }
 
+# Numeric properties of all materials as one read-only record array, one
+# record per MATERIALS entry in the same order (see get_material_table)
+MATERIAL_NAMES: Tuple[str, ...] = tuple(MATERIALS)
+_NUMERIC_PROPERTIES = (
+    "yield_strength",
+    "tensile_strength",
+    "elastic_modulus",
+    "poisson_ratio",
+    "density",
+    "max_temperature",
+)
+MATERIAL_TABLE = np.rec.fromrecords(
+    [tuple(getattr(material, prop) for prop in _NUMERIC_PROPERTIES)
+     for material in MATERIALS.values()],
+    dtype=[(prop, np.float64) for prop in _NUMERIC_PROPERTIES],
+)
+MATERIAL_TABLE.flags.writeable = False
+_MATERIAL_ROWS: Dict[MaterialProperties, int] = {
+    material: row for row, material in enumerate(MATERIALS.values())
+}
+
+# Bottle type -> material name for get_bottle_material (read-only)
+BOTTLE_MATERIALS: Mapping[str, str] = MappingProxyType({
+    "soda": "PET",
+    "water": "PET",
+    "cola": "PET",
+    "milk": "HDPE",
+    "detergent": "HDPE",
+    "shampoo": "HDPE",
+})
+
 
+@lru_cache(maxsize=None)
 def get_material(name: str) -> MaterialProperties:
     """
     Retrieve material properties by name.
 
+    Lookups are memoized: every simulation step resolves its material by
+    name, and the name normalization only needs to run once per distinct
+    spelling. The database entry itself is returned, so treat it as
+    read-only.
+
     Args:
         name: Material identifier (case-insensitive)
               Available: "PET", "HDPE", "PP", "Aluminum_6061_T6", "Steel_304"
@@ -119,14 +169,10 @@ def get_material(name: str) -> MaterialProperties:
     # Normalize material name
     normalized = name.strip().replace(" ", "_").replace("-", "_")
 
-    # Try exact match first
-    if normalized in MATERIALS:
-        return MATERIALS[normalized]
-
-    # Try case-insensitive match
-    for key in MATERIALS:
-        if key.lower() == normalized.lower():
-            return MATERIALS[key]
+    # Case-insensitive match via the precomputed index
+    material = _MATERIALS_BY_LOWER_NAME.get(normalized.lower())
+    if material is not None:
+        return material
 
     # Material not found
     available = ", ".join(MATERIALS.keys())
@@ -151,6 +197,38 @@ def list_available_materials() -> list[str]:
     return list(MATERIALS.keys())
 
 
+def get_material_table(names: Optional[Iterable[str]] = None) -> np.ndarray:
+    """
+    Retrieve numeric properties of several materials as a structured array.
+
+    Material comparisons can then work on whole columns (e.g.
+    ``table["yield_strength"] / table["density"]``) instead of looking up
+    each MaterialProperties object in a loop. Fields are also readable as
+    attributes (``table.yield_strength``), so a table can stand in for a
+    single material in the thin-wall burst and safety-factor functions,
+    which then evaluate every selected material in one pass.
+
+    Args:
+        names: Material identifiers (case-insensitive, as for get_material).
+               None returns the full table in MATERIAL_NAMES order.
+
+    Returns:
+        Record array with fields yield_strength, tensile_strength,
+        elastic_modulus, poisson_ratio, density and max_temperature
+
+    Raises:
+        ValueError: If a material is not found in database
+
+    Example:
+        >>> table = get_material_table(["PET", "HDPE"])
+        >>> print(table["yield_strength"] / 1e6)
+        [55. 26.]
+    """
+    if names is None:
+        return MATERIAL_TABLE
+    return MATERIAL_TABLE[[_MATERIAL_ROWS[get_material(name)] for name in names]]
+
+
 def get_material_summary(name: str) -> str:
     """
     Get a human-readable summary of material properties.
@@ -195,18 +273,9 @@ def get_bottle_material(bottle_type: str = "soda") -> MaterialProperties:
         >>> print(soda_bottle.name)
         Polyethylene Terephthalate (PET)
     """
-    bottle_map = {
-        "soda": "PET",
-        "water": "PET",
-        "cola": "PET",
-        "milk": "HDPE",
-        "detergent": "HDPE",
-        "shampoo": "HDPE",
-    }
-
-    material_name = bottle_map.get(bottle_type.lower())
+    material_name = BOTTLE_MATERIALS.get(bottle_type.lower())
     if material_name is None:
-        available = ", ".join(bottle_map.keys())
+        available = ", ".join(BOTTLE_MATERIALS.keys())
         raise ValueError(
             f"Unknown bottle type '{bottle_type}'. "
             f"Available: {available}"
@@ -216,22 +285,28 @@ def get_bottle_material(bottle_type: str = "soda") -> MaterialProperties:
 
 
 if __name__ == "__main__":
-    # Demonstration
-    print("=== Material Properties Database ===\n")
+    import io
+    import sys
 
-    print("Available materials:")
+    # Demonstration (assembled in memory and written in one go)
+    out = io.StringIO()
+    print("=== Material Properties Database ===\n", file=out)
+
+    print("Available materials:", file=out)
     for mat_name in list_available_materials():
-        print(f"  - {mat_name}")
+        print(f"  - {mat_name}", file=out)
 
-    print("\n" + "="*50 + "\n")
+    print("\n" + "="*50 + "\n", file=out)
 
-    print(get_material_summary("PET"))
-    print("\n" + "="*50 + "\n")
+    print(get_material_summary("PET"), file=out)
+    print("\n" + "="*50 + "\n", file=out)
 
-    print(get_material_summary("Aluminum_6061_T6"))
-    print("\n" + "="*50 + "\n")
+    print(get_material_summary("Aluminum_6061_T6"), file=out)
+    print("\n" + "="*50 + "\n", file=out)
 
     # Common bottle example
     soda = get_bottle_material("soda")
-    print(f"Soda bottle material: {soda.name}")
-    print(f"Yield strength: {soda.yield_strength/1e6:.1f} MPa")
+    print(f"Soda bottle material: {soda.name}", file=out)
+    print(f"Yield strength: {soda.yield_strength/1e6:.1f} MPa", file=out)
+
+    sys.stdout.write(out.getvalue())
@@ -11,8 +11,6 @@ Requirements: FR-2 (ODE solver), FR-3 (Burst prediction), NFR-5 (Performance)
 """
 
 import numpy as np
-from scipy.integrate import solve_ivp
-from scipy.interpolate import interp1d
 from dataclasses import dataclass, field
 from typing import Optional, Callable, Tuple
 import warnings
@@ -21,13 +19,15 @@ from ..combustion.cantera_wrapper import CombustionResult
 from .materials import MaterialProperties
 from .burst_calculator import (
     VesselGeometry,
-    calculate_stress_state,
+    validate_thin_wall_assumption,
     calculate_safety_factor,
-    check_failure
+    check_failure,
+    _allowable_stress,
+    _thin_wall_stress_state
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemState:
     """
     Complete system state over time.
@@ -97,7 +97,7 @@ def simulate_system_dynamics(
         geometry: Vessel geometry
         material: Material properties
         end_time: Simulation end time (s). If None, use combustion end time.
-        max_step: Maximum ODE integration step size (s)
+        max_step: Time resolution of the computed history (s)
         failure_criterion: "yield" (conservative) or "ultimate" (catastrophic)
         include_deformation: If True, account for elastic volume change
 
@@ -121,12 +121,17 @@ def simulate_system_dynamics(
         >>> if sys_result.failed:
         ...     print(f"Failed at t={sys_result.failure_time:.4f} s")
     """
+    # SciPy's subpackages take a noticeable time to import; load them only
+    # when a simulation is run, not whenever system_model is imported
+    from scipy.interpolate import interp1d
+    from scipy.optimize import brentq
+
     # Determine simulation time
     if end_time is None:
         end_time = combustion_result.time[-1]
 
     # Create interpolation function for combustion pressure
-    # This allows us to query P(t) at any time during ODE integration
+    # This allows us to query P(t) at any time during the failure search
     P_interp = interp1d(
         combustion_result.time,
         combustion_result.pressure,
@@ -143,123 +148,91 @@ def simulate_system_dynamics(
         bounds_error=False
     )
 
-    # Initial volume
-    V0 = geometry.inner_diameter**2 * np.pi / 4 * (geometry.length or 0.3)
-    if geometry.length is None:
+    # Initial volume (only a missing length falls back to the default)
+    V0 = geometry.internal_volume
+    if V0 is None:
         warnings.warn(
             "Vessel length not specified, assuming 0.3 m for volume calculation",
             UserWarning
         )
+        V0 = geometry.cross_section_area * 0.3
+
+    # The geometry is checked once here; the stress evaluations below use
+    # the unchecked kernel
+    validate_thin_wall_assumption(geometry)
+
+    # Stresses scale linearly with pressure, so SF = 1 exactly when P reaches
+    # P_fail; failure detection reduces to a search on the pressure history.
+    P_fail = (_allowable_stress(material, failure_criterion)
+              / _thin_wall_stress_state(1.0, geometry).von_mises_stress)
 
-    # Storage for results
-    time_points = []
-    pressure_points = []
-    temperature_points = []
-    volume_points = []
-    hoop_stress_points = []
-    axial_stress_points = []
-    vm_stress_points = []
-    safety_factor_points = []
-    strain_points = []
-
-    # Event function to detect failure
-    failure_detected = [False]
-    failure_time_val = [None]
-
-    def failure_event(t, y):
-        """Event function: SF = 1.0 triggers failure."""
-        P = P_interp(t)
-        SF = calculate_safety_factor(P, geometry, material, criterion=failure_criterion)
-        return SF - 1.0  # Zero when SF = 1
-
-    failure_event.terminal = True  # Stop integration at failure
-    failure_event.direction = -1   # Trigger when SF decreases through 1
-
-    # ODE system (simplified - just track time and compute stresses)
-    def system_ode(t, y):
-        """
-        ODE system for rocket dynamics.
-
-        For now, this is simplified: we track the combustion pressure
-        and compute stresses analytically. Future: add thermal expansion,
-        gas leakage, etc.
-        """
-        # y[0] could be a state variable if needed
-        # For this version, we just use t to query combustion data
-        return [0.0]  # Dummy derivative
-
-    # Time span
-    t_span = (0, end_time)
+    def failure_margin(t):
+        """Failure margin: positive while safe, zero when SF = 1."""
+        return P_fail - P_interp(t)
+
+    # Output time grid
     t_eval = np.linspace(0, end_time, int(end_time / max_step))
 
-    # Solve ODE (in this simple version, just time-stepping)
-    sol = solve_ivp(
-        system_ode,
-        t_span,
-        [0.0],  # Dummy initial condition
-        method='RK45',
-        t_eval=t_eval,
-        events=failure_event,
-        max_step=max_step,
-        rtol=1e-6,
-        atol=1e-9
+    # The pressure history is prescribed by the combustion result, so there
+    # is no state to integrate: evaluate the margin on the whole grid, take
+    # the first downward crossing (SF decreasing through 1) and refine it
+    # with Brent's method
+    failure_time = None
+    if len(t_eval) > 1:
+        margin = failure_margin(t_eval)
+        crossings = np.flatnonzero((margin[:-1] >= 0) & (margin[1:] <= 0))
+        if crossings.size:
+            i = crossings[0]
+            failure_time = brentq(failure_margin, t_eval[i], t_eval[i + 1],
+                                  xtol=4 * np.finfo(float).eps)
+
+    failed = failure_time is not None
+    if failed:
+        # Stop the history at failure, ending exactly at the failure point
+        # (the grid is sorted, so a binary search replaces a full mask).
+        # The truncated grid is filled into one preallocated array.
+        n_kept = np.searchsorted(t_eval, failure_time, side='right')
+        time_array = np.empty(n_kept + 1)
+        time_array[:n_kept] = t_eval[:n_kept]
+        time_array[n_kept] = failure_time
+    else:
+        time_array = t_eval
+
+    # Evaluate the whole time history at once: the thin-wall stress formulas
+    # are element-wise, so array inputs avoid a Python loop per time point
+    pressure = P_interp(time_array)
+    temperature = T_interp(time_array)
+
+    stress_state = _thin_wall_stress_state(pressure, geometry)
+    safety_factor = calculate_safety_factor(
+        pressure, geometry, material, criterion=failure_criterion,
+        stress_state=stress_state
     )
 
-    # Check if failure occurred
-    if len(sol.t_events[0]) > 0:
-        failure_detected[0] = True
-        failure_time_val[0] = sol.t_events[0][0]
-        # Extend time array to include failure point
-        time_array = np.append(sol.t, failure_time_val[0])
+    # Calculate strain (elastic)
+    epsilon_hoop = stress_state.hoop_stress / material.elastic_modulus
+
+    # Volume change (if including deformation)
+    if include_deformation:
+        # ΔV/V ≈ 2*ε_hoop + ε_axial (for thin cylinder)
+        epsilon_axial = stress_state.axial_stress / material.elastic_modulus
+        volume = V0 * (1 + 2 * epsilon_hoop + epsilon_axial)
     else:
-        time_array = sol.t
-
-    # Calculate stresses and safety factors at each time point
-    for t in time_array:
-        P = P_interp(t)
-        T = T_interp(t)
-
-        # Calculate stresses
-        stress_state = calculate_stress_state(P, geometry)
-        SF = calculate_safety_factor(P, geometry, material, criterion=failure_criterion)
-
-        # Calculate strain (elastic)
-        epsilon_hoop = stress_state.hoop_stress / material.elastic_modulus
-
-        # Volume change (if including deformation)
-        if include_deformation:
-            # ΔV/V ≈ 2*ε_hoop + ε_axial (for thin cylinder)
-            epsilon_axial = stress_state.axial_stress / material.elastic_modulus
-            dV_V = 2 * epsilon_hoop + epsilon_axial
-            V = V0 * (1 + dV_V)
-        else:
-            V = V0
-
-        # Store results
-        time_points.append(t)
-        pressure_points.append(P)
-        temperature_points.append(T)
-        volume_points.append(V)
-        hoop_stress_points.append(stress_state.hoop_stress)
-        axial_stress_points.append(stress_state.axial_stress)
-        vm_stress_points.append(stress_state.von_mises_stress)
-        safety_factor_points.append(SF)
-        strain_points.append(epsilon_hoop)
-
-    # Convert to arrays
+        volume = np.full_like(time_array, V0, dtype=float)
+
     result = SystemState(
-        time=np.array(time_points),
-        pressure=np.array(pressure_points),
-        temperature=np.array(temperature_points),
-        volume=np.array(volume_points),
-        hoop_stress=np.array(hoop_stress_points),
-        axial_stress=np.array(axial_stress_points),
-        von_mises_stress=np.array(vm_stress_points),
-        safety_factor=np.array(safety_factor_points),
-        strain_hoop=np.array(strain_points),
-        failed=failure_detected[0],
-        failure_time=failure_time_val[0],
-        failure_mode="Yield exceeded" if failure_detected[0] else None
+        time=np.asarray(time_array, dtype=float),
+        pressure=pressure,
+        temperature=temperature,
+        volume=volume,
+        hoop_stress=stress_state.hoop_stress,
+        axial_stress=stress_state.axial_stress,
+        von_mises_stress=stress_state.von_mises_stress,
+        safety_factor=safety_factor,
+        strain_hoop=epsilon_hoop,
+        failed=failed,
+        failure_time=failure_time,
+        failure_mode="Yield exceeded" if failed else None
     )
 
     return result
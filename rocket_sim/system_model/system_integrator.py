@@ -8,8 +8,9 @@ Requirements: FR-1, FR-2, FR-3, FR-6 (Parametric studies)
 """
 
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Tuple, Optional, List
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from ..combustion.cantera_wrapper import (
     simulate_combustion,
@@ -25,11 +26,14 @@ from .burst_calculator import (
 from .ode_solver import simulate_system_dynamics, SystemState
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SimulationConfig:
     """
     Complete configuration for end-to-end simulation.
 
+    Immutable and hashable, so configurations can be shared between runs
+    and used as cache keys; use dataclasses.replace() to derive variants.
+
     Attributes:
         # Combustion parameters
         vessel_volume: Internal volume (m³)
@@ -68,12 +72,41 @@ class SimulationConfig:
     failure_criterion: str = "yield"
 
 
-def run_full_simulation(config: SimulationConfig) -> Tuple[CombustionResult, SystemState]:
+def _combustion_key(config: SimulationConfig) -> Tuple[float, ...]:
+    """Return the configuration fields that determine the combustion result."""
+    return (
+        config.vessel_volume,
+        config.fuel_oxidizer_ratio,
+        config.initial_temperature,
+        config.initial_pressure,
+        config.combustion_time,
+        config.max_step,
+    )
+
+
+def _run_combustion(config: SimulationConfig) -> CombustionResult:
+    """Run the Cantera combustion simulation for a configuration."""
+    return simulate_combustion(
+        volume=config.vessel_volume,
+        mix_ratio=config.fuel_oxidizer_ratio,
+        T0=config.initial_temperature,
+        P0=config.initial_pressure,
+        end_time=config.combustion_time,
+        n_points=int(config.combustion_time / config.max_step)
+    )
+
+
+def run_full_simulation(
+    config: SimulationConfig,
+    combustion_result: Optional[CombustionResult] = None
+) -> Tuple[CombustionResult, SystemState]:
     """
     Run complete end-to-end simulation: combustion → system dynamics → failure.
 
     Args:
         config: Simulation configuration
+        combustion_result: Previously computed combustion result for this
+            configuration. If given, the Cantera simulation is not re-run.
 
     Returns:
         (combustion_result, system_state) tuple
@@ -91,17 +124,13 @@ def run_full_simulation(config: SimulationConfig) -> Tuple[CombustionResult, Sys
         >>> if sys.failed:
         ...     print(f"FAILED at t={sys.failure_time:.4f} s")
     """
-    # Step 1: Run combustion simulation (Module 1)
-    print(f"Running combustion simulation (V={config.vessel_volume*1e3:.1f} L, MR={config.fuel_oxidizer_ratio})...")
+    # Step 1: Run combustion simulation (Module 1), unless already available
+    if combustion_result is None:
+        print(f"Running combustion simulation (V={config.vessel_volume*1e3:.1f} L, MR={config.fuel_oxidizer_ratio})...")
 
-    combustion_result = simulate_combustion(
-        volume=config.vessel_volume,
-        mix_ratio=config.fuel_oxidizer_ratio,
-        T0=config.initial_temperature,
-        P0=config.initial_pressure,
-        end_time=config.combustion_time,
-        n_points=int(config.combustion_time / config.max_step)
-    )
+        combustion_result = _run_combustion(config)
+    else:
+        print(f"Using precomputed combustion result (V={config.vessel_volume*1e3:.1f} L, MR={config.fuel_oxidizer_ratio})")
 
     print(f"  Peak combustion pressure: {np.max(combustion_result.pressure)/1e5:.2f} bar")
     print(f"  Peak temperature: {np.max(combustion_result.temperature):.0f} K")
@@ -152,39 +181,93 @@ def run_full_simulation(config: SimulationConfig) -> Tuple[CombustionResult, Sys
 def run_parametric_study(
     base_config: SimulationConfig,
     parameter_name: str,
-    parameter_values: List[float]
+    parameter_values: List[float],
+    max_workers: Optional[int] = None,
+    combustion_cache: Optional[Dict[Tuple[float, ...], CombustionResult]] = None
 ) -> List[Tuple[float, CombustionResult, SystemState]]:
     """
     Run parametric study varying one parameter.
 
+    Each parameter value is an independent end-to-end simulation, so the
+    runs can be distributed over worker processes. Processes (rather than
+    threads) are used because the Cantera reactor integration holds the GIL.
+
+    Runs whose combustion inputs (volume, mixture ratio, initial state,
+    time span) match an earlier run reuse its combustion result, so
+    sweeping a vessel parameter runs Cantera only once. With worker
+    processes, only the distinct combustion cases are farmed out (and only
+    when there are at least two); the inexpensive system-dynamics step then
+    runs in the calling process.
+
+    Passing the same combustion_cache dictionary to several studies extends
+    this reuse across them: the base configuration, which typically appears
+    in every sweep, then runs Cantera once for the whole set of studies.
+
     Args:
         base_config: Base configuration
         parameter_name: Name of parameter to vary (e.g., "fuel_oxidizer_ratio")
         parameter_values: List of values to test
+        max_workers: Number of worker processes. None or 1 runs the study
+                     serially in the calling process.
+        combustion_cache: Optional dictionary of combustion results shared
+                          between studies. It is read and updated in place;
+                          results are shared, so treat them as read-only.
 
     Returns:
-        List of (parameter_value, combustion_result, system_state) tuples
+        List of (parameter_value, combustion_result, system_state) tuples,
+        in the order of parameter_values
 
     Example:
         >>> config = SimulationConfig(vessel_volume=0.001, fuel_oxidizer_ratio=2.0)
         >>> results = run_parametric_study(config, "fuel_oxidizer_ratio", [1.5, 2.0, 2.5, 3.0])
         >>> for val, comb, sys in results:
         ...     print(f"MR={val}: P_max={np.max(sys.pressure)/1e5:.1f} bar, Failed={sys.failed}")
+        >>> cache = {}
+        >>> mr = run_parametric_study(config, "fuel_oxidizer_ratio", [1.5, 2.0], combustion_cache=cache)
+        >>> wall = run_parametric_study(config, "vessel_thickness", [3e-4, 5e-4], combustion_cache=cache)
     """
-    results = []
+    # Create modified configs (the base config is left untouched)
+    configs = [replace(base_config, **{parameter_name: value}) for value in parameter_values]
 
     print(f"=== Parametric Study: {parameter_name} ===")
     print(f"Testing {len(parameter_values)} values...\n")
 
-    for i, value in enumerate(parameter_values):
-        print(f"[{i+1}/{len(parameter_values)}] {parameter_name} = {value}")
+    if combustion_cache is None:
+        combustion_cache = {}
+
+    if max_workers is not None and max_workers > 1:
+        # One representative configuration per distinct set of combustion
+        # inputs not already cached, in first-seen order
+        distinct: Dict[Tuple[float, ...], SimulationConfig] = {}
+        for config in configs:
+            key = _combustion_key(config)
+            if key not in combustion_cache:
+                distinct.setdefault(key, config)
+
+        # A single case gains nothing from a pool (it would only add process
+        # start-up), so it is left to the serial loop below. Cases are sent
+        # in chunks of several per task to amortise the pickling round trips
+        # on long sweeps, with no more workers than cases.
+        if len(distinct) > 1:
+            n_workers = min(max_workers, len(distinct))
+            chunksize = max(1, len(distinct) // (4 * n_workers))
+            print(f"Running {len(distinct)} combustion cases on {n_workers} worker processes\n")
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                combustion_cache.update(
+                    zip(distinct, executor.map(_run_combustion, distinct.values(),
+                                               chunksize=chunksize))
+                )
 
-        # Create modified config
-        config = SimulationConfig(**vars(base_config))
-        setattr(config, parameter_name, value)
+    results = []
 
-        # Run simulation
-        comb, sys = run_full_simulation(config)
+    for i, (value, config) in enumerate(zip(parameter_values, configs)):
+        print(f"[{i+1}/{len(parameter_values)}] {parameter_name} = {value}")
+
+        # Run simulation, reusing the combustion result of any earlier run
+        # with the same combustion inputs (e.g. when sweeping wall thickness)
+        key = _combustion_key(config)
+        comb, sys = run_full_simulation(config, combustion_result=combustion_cache.get(key))
+        combustion_cache[key] = comb
 
         results.append((value, comb, sys))
         print()
@@ -192,6 +275,50 @@ def run_parametric_study(
     return results
 
 
+def summarize_parametric_study(
+    results: List[Tuple[float, CombustionResult, SystemState]]
+) -> Dict[str, np.ndarray]:
+    """
+    Collect key metrics of a parametric study into per-metric arrays.
+
+    Turns the per-run (value, combustion, system) tuples into one array per
+    metric, so a study can be compared, filtered or plotted with whole-array
+    operations instead of re-walking the result objects.
+
+    Args:
+        results: Output of run_parametric_study
+
+    Returns:
+        Dictionary of arrays, one entry per run (in study order):
+        - parameter_value: Varied parameter value
+        - peak_pressure: Peak system pressure (Pa)
+        - peak_temperature: Peak temperature (K)
+        - peak_hoop_stress: Peak hoop stress (Pa)
+        - min_safety_factor: Minimum safety factor
+        - failed: Whether the vessel failed
+        - failure_time: Failure time (s), NaN for intact runs
+
+    Example:
+        >>> results = run_parametric_study(config, "fuel_oxidizer_ratio", [1.5, 2.0, 2.5])
+        >>> summary = summarize_parametric_study(results)
+        >>> best = summary['parameter_value'][np.argmax(summary['min_safety_factor'])]
+    """
+    n = len(results)
+    systems = [sys for _, _, sys in results]
+
+    return {
+        'parameter_value': np.fromiter((val for val, _, _ in results), float, n),
+        'peak_pressure': np.fromiter((np.max(s.pressure) for s in systems), float, n),
+        'peak_temperature': np.fromiter((np.max(s.temperature) for s in systems), float, n),
+        'peak_hoop_stress': np.fromiter((np.max(s.hoop_stress) for s in systems), float, n),
+        'min_safety_factor': np.fromiter((np.min(s.safety_factor) for s in systems), float, n),
+        'failed': np.fromiter((s.failed for s in systems), bool, n),
+        'failure_time': np.fromiter(
+            (s.failure_time if s.failed else np.nan for s in systems), float, n
+        ),
+    }
+
+
 def estimate_safe_operating_pressure(
     geometry: VesselGeometry,
     material: MaterialProperties,
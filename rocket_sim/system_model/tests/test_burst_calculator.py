@@ -7,10 +7,12 @@ Tests analytical pressure vessel calculations
 
 import pytest
 import numpy as np
+from dataclasses import FrozenInstanceError, replace
 from rocket_sim.system_model.materials import get_material
 from rocket_sim.system_model.burst_calculator import (
     VesselGeometry,
     StressState,
+    FailureCheck,
     validate_thin_wall_assumption,
     calculate_hoop_stress,
     calculate_axial_stress,
@@ -20,6 +22,8 @@ from rocket_sim.system_model.burst_calculator import (
     calculate_safety_factor,
     check_failure,
     predict_failure_pressure,
+    DESIGN_SPACE_DTYPE,
+    sweep_design_space,
 )
 
 
@@ -42,6 +46,26 @@ class TestVesselGeometry:
         geom = VesselGeometry(inner_diameter=0.1, wall_thickness=0.001)
         assert geom.length is None
 
+    def test_vessel_geometry_is_immutable(self):
+        """Test that geometry is frozen and usable as a dictionary key."""
+        geom = VesselGeometry(inner_diameter=0.1, wall_thickness=0.001)
+        with pytest.raises(FrozenInstanceError):
+            geom.wall_thickness = 0.002
+        assert {geom: 1}[VesselGeometry(inner_diameter=0.1, wall_thickness=0.001)] == 1
+
+    def test_thickness_ratio_derived(self):
+        """Test that t/D is derived at construction and follows replace()."""
+        geom = VesselGeometry(inner_diameter=0.1, wall_thickness=0.001)
+        assert geom.thickness_ratio == pytest.approx(0.01)
+        assert replace(geom, wall_thickness=0.002).thickness_ratio == pytest.approx(0.02)
+
+    def test_internal_volume_derived(self):
+        """Test the derived cross-section area and internal volume."""
+        geom = VesselGeometry(inner_diameter=0.1, wall_thickness=0.001, length=0.3)
+        assert geom.cross_section_area == pytest.approx(np.pi * 0.1**2 / 4)
+        assert geom.internal_volume == pytest.approx(geom.cross_section_area * 0.3)
+        assert VesselGeometry(inner_diameter=0.1, wall_thickness=0.001).internal_volume is None
+
 
 class TestThinWallValidation:
     """Test thin-wall assumption validation."""
@@ -128,6 +152,22 @@ class TestStressCalculations:
         assert state.von_mises_stress > 0
         assert state.hoop_stress == 2 * state.axial_stress
 
+    def test_von_mises_stress_negative_pressure(self):
+        """Test that external (negative) pressure gives a non-negative von Mises stress."""
+        geom = VesselGeometry(inner_diameter=0.1, wall_thickness=0.001)
+
+        state = calculate_stress_state(-1e6, geom)
+
+        assert state.hoop_stress < 0
+        assert state.von_mises_stress >= 0
+        assert np.isclose(state.von_mises_stress,
+                          calculate_von_mises_stress(state.hoop_stress,
+                                                     state.axial_stress),
+                          rtol=1e-10)
+        assert np.isclose(state.von_mises_stress,
+                          calculate_stress_state(1e6, geom).von_mises_stress,
+                          rtol=1e-10)
+
 
 class TestBurstPressure:
     """Test burst pressure calculations."""
@@ -197,6 +237,19 @@ class TestSafetyFactor:
         assert np.isclose(SF, expected_SF, rtol=1e-10)
         assert SF > 1.0  # Should be safe at 300 kPa
 
+    def test_safety_factor_reuses_stress_state(self):
+        """A precomputed stress state gives the same safety factors."""
+        geom = VesselGeometry(inner_diameter=0.1, wall_thickness=0.001)
+        pet = get_material("PET")
+        pressures = np.array([0.0, 200e3, 500e3])
+
+        state = calculate_stress_state(pressures, geom)
+        SF = calculate_safety_factor(pressures, geom, pet, stress_state=state)
+
+        np.testing.assert_array_equal(
+            SF, calculate_safety_factor(pressures, geom, pet)
+        )
+
     def test_safety_factor_at_burst(self):
         """Test that SF ≈ 1.0 at burst pressure."""
         geom = VesselGeometry(inner_diameter=0.1, wall_thickness=0.001)
@@ -218,6 +271,33 @@ class TestSafetyFactor:
 
         assert SF1 > SF2 > SF3
 
+    def test_safety_factor_array_matches_scalar(self):
+        """Test that a pressure array gives the same result as scalar calls."""
+        geom = VesselGeometry(inner_diameter=0.1, wall_thickness=0.001)
+        pet = get_material("PET")
+        pressures = np.array([0.0, 100e3, 200e3, 400e3])
+
+        SF = calculate_safety_factor(pressures, geom, pet)
+
+        assert SF.shape == pressures.shape
+        assert np.isinf(SF[0])
+        for P, SF_i in zip(pressures[1:], SF[1:]):
+            assert np.isclose(SF_i, calculate_safety_factor(P, geom, pet))
+
+
+    def test_safety_factor_negative_pressure(self):
+        """Test that external (negative) pressure gives a finite safety factor."""
+        geom = VesselGeometry(inner_diameter=0.1, wall_thickness=0.001)
+        pet = get_material("PET")
+
+        SF = calculate_safety_factor(-1e6, geom, pet)
+
+        assert np.isfinite(SF)
+        assert np.isclose(SF, calculate_safety_factor(1e6, geom, pet), rtol=1e-10)
+        SF_array = calculate_safety_factor(np.array([-1e6, 0.0]), geom, pet)
+        assert np.isclose(SF_array[0], SF, rtol=1e-10)
+        assert np.isinf(SF_array[1])
+
 
 class TestFailureDetection:
     """Test failure detection."""
@@ -256,6 +336,28 @@ class TestFailureDetection:
         assert failed
         assert SF < 1.0
 
+    def test_check_failure_array(self):
+        """Test element-wise failure detection over a pressure sweep."""
+        geom = VesselGeometry(inner_diameter=0.1, wall_thickness=0.001)
+        pet = get_material("PET")
+
+        P_burst = predict_failure_pressure(geom, pet)
+        failed, SF = check_failure(np.array([0.5, 1.5]) * P_burst, geom, pet)
+
+        assert list(failed) == [False, True]
+        assert SF[0] > 1.0 > SF[1]
+
+    def test_check_failure_named_fields(self):
+        """Test that the result exposes named fields as well as unpacking."""
+        geom = VesselGeometry(inner_diameter=0.1, wall_thickness=0.001)
+        pet = get_material("PET")
+
+        check = check_failure(200e3, geom, pet)
+
+        assert isinstance(check, FailureCheck)
+        assert check.failed is check[0]
+        assert check.safety_factor == calculate_safety_factor(200e3, geom, pet)
+
 
 class TestPredictFailurePressure:
     """Test failure pressure prediction."""
@@ -340,6 +442,64 @@ class TestParametricStudies:
         assert pressures[0] > pressures[1] > pressures[2]
         assert np.isclose(pressures[1], pressures[0] * 0.05 / 0.10, rtol=1e-6)
 
+    def test_thickness_sweep_broadcasts(self):
+        """Test that an array of thicknesses is evaluated in one call."""
+        pet = get_material("PET")
+        thicknesses = np.array([0.0002, 0.0004, 0.0006])
+        geom = VesselGeometry(inner_diameter=0.1, wall_thickness=thicknesses)
+
+        P_burst = calculate_burst_pressure(geom, pet)
+        SF = calculate_safety_factor(300e3, geom, pet)
+
+        for i, t in enumerate(thicknesses):
+            single = VesselGeometry(inner_diameter=0.1, wall_thickness=t)
+            assert np.isclose(P_burst[i], calculate_burst_pressure(single, pet))
+            assert np.isclose(SF[i], calculate_safety_factor(300e3, single, pet))
+
+    def test_thickness_sweep_rejects_thick_wall_member(self):
+        """Test that one thick-walled design in a sweep fails validation."""
+        geom = VesselGeometry(inner_diameter=0.1,
+                              wall_thickness=np.array([0.001, 0.02]))
+        with pytest.raises(ValueError, match="Thin-wall assumption violated"):
+            calculate_stress_state(500e3, geom)
+
+    def test_design_space_grid_matches_point_calls(self):
+        """Test the thickness × pressure grid against per-point results."""
+        pet = get_material("PET")
+        thicknesses = np.array([0.0002, 0.0004, 0.0006])
+        pressures = np.array([-300e3, 0.0, 200e3, 600e3, 900e3])
+
+        grid = sweep_design_space(0.095, thicknesses, pressures, pet)
+
+        assert grid.shape == (3, 5)
+        assert np.all(np.isfinite(grid["safety_factor"][:, 0]))
+        for i, t in enumerate(thicknesses):
+            geom = VesselGeometry(inner_diameter=0.095, wall_thickness=t)
+            assert np.isclose(grid["burst_pressure"][i, 0],
+                              calculate_burst_pressure(geom, pet))
+            for j, P in enumerate(pressures):
+                state = calculate_stress_state(P, geom)
+                assert np.isclose(grid["hoop_stress"][i, j], state.hoop_stress)
+                assert np.isclose(grid["von_mises_stress"][i, j],
+                                  state.von_mises_stress)
+                assert grid["safety_factor"][i, j] == pytest.approx(
+                    calculate_safety_factor(P, geom, pet))
+
+    def test_design_space_grid_views_as_float_array(self):
+        """Test that the grid can be viewed as (N, M, fields) floats without a copy."""
+        grid = sweep_design_space(0.095, np.array([0.0002, 0.0004]),
+                                  np.array([100e3, 300e3, 500e3]),
+                                  get_material("PET"))
+
+        n_fields = len(DESIGN_SPACE_DTYPE.names)
+        values = grid.view((np.float64, n_fields))
+
+        assert grid.flags.c_contiguous
+        assert values.shape == (2, 3, n_fields)
+        assert np.shares_memory(values, grid)
+        assert np.array_equal(values[..., DESIGN_SPACE_DTYPE.names.index("hoop_stress")],
+                              grid["hoop_stress"])
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -7,14 +7,20 @@ Tests the integration between combustion simulation and system dynamics
 
 import pytest
 import numpy as np
+from dataclasses import FrozenInstanceError, replace
+from unittest.mock import patch
 from rocket_sim.combustion.cantera_wrapper import simulate_combustion
 from rocket_sim.system_model import (
     get_material,
     VesselGeometry,
     simulate_system_dynamics,
     run_full_simulation,
+    run_parametric_study,
+    summarize_parametric_study,
     SimulationConfig,
     calculate_burst_pressure,
+    calculate_stress_state,
+    calculate_safety_factor,
 )
 
 
@@ -94,6 +100,26 @@ class TestModule1ToModule2Integration:
         # Should be within 10% (interpolation differences)
         assert np.isclose(comb_peak, sys_peak, rtol=0.1)
 
+    def test_full_simulation_reuses_combustion_result(self):
+        """Test that a precomputed combustion result is used as-is."""
+        config = SimulationConfig(
+            vessel_volume=0.001,
+            fuel_oxidizer_ratio=2.0,
+            combustion_time=0.001,
+            max_step=1e-5
+        )
+        comb_result = simulate_combustion(
+            volume=0.001,
+            mix_ratio=2.0,
+            end_time=0.001,
+            n_points=100
+        )
+
+        comb_out, sys_result = run_full_simulation(config, combustion_result=comb_result)
+
+        assert comb_out is comb_result
+        assert len(sys_result.time) > 0
+
     def test_safety_factor_behavior(self):
         """Test that safety factor decreases with increasing pressure."""
         config = SimulationConfig(
@@ -223,6 +249,146 @@ class TestPhysicalConsistency:
         assert sys_result.hoop_stress[idx_max_p] > sys_result.hoop_stress[idx_min_p]
         assert sys_result.von_mises_stress[idx_max_p] > sys_result.von_mises_stress[idx_min_p]
 
+    def test_history_matches_pointwise_stress(self):
+        """Test that the stress history matches point-by-point evaluation."""
+        config = SimulationConfig(
+            vessel_volume=0.001,
+            fuel_oxidizer_ratio=2.0,
+            combustion_time=0.001
+        )
+
+        _, sys_result = run_full_simulation(config)
+
+        geometry = VesselGeometry(
+            inner_diameter=config.vessel_diameter,
+            wall_thickness=config.vessel_thickness
+        )
+        material = get_material(config.vessel_material)
+
+        for i in (0, len(sys_result.time) // 2, len(sys_result.time) - 1):
+            P = sys_result.pressure[i]
+            state = calculate_stress_state(P, geometry)
+            assert np.isclose(sys_result.hoop_stress[i], state.hoop_stress)
+            assert np.isclose(sys_result.von_mises_stress[i], state.von_mises_stress)
+            assert np.isclose(
+                sys_result.safety_factor[i],
+                calculate_safety_factor(P, geometry, material)
+            )
+
+
+class TestParametricStudy:
+    """Test parametric study execution."""
+
+    def test_config_is_frozen_and_hashable(self):
+        """Test that configurations are immutable value objects."""
+        config = SimulationConfig(vessel_volume=0.001, fuel_oxidizer_ratio=2.0)
+
+        with pytest.raises(FrozenInstanceError):
+            config.fuel_oxidizer_ratio = 3.0
+        assert hash(config) == hash(
+            SimulationConfig(vessel_volume=0.001, fuel_oxidizer_ratio=2.0))
+        assert replace(config, vessel_thickness=0.001).vessel_thickness == 0.001
+
+    def test_parallel_study_matches_serial(self):
+        """Test that worker processes give the same ordered results as a serial run."""
+        config = SimulationConfig(
+            vessel_volume=0.001,
+            fuel_oxidizer_ratio=2.0,
+            combustion_time=0.001
+        )
+        values = [1.5, 2.0, 2.5]
+
+        serial = run_parametric_study(config, "fuel_oxidizer_ratio", values)
+        parallel = run_parametric_study(config, "fuel_oxidizer_ratio", values, max_workers=2)
+
+        assert [val for val, _, _ in parallel] == values
+        for (_, _, sys_s), (_, _, sys_p) in zip(serial, parallel):
+            assert np.allclose(sys_s.pressure, sys_p.pressure)
+
+        # Base configuration is not modified
+        assert config.fuel_oxidizer_ratio == 2.0
+
+    def test_vessel_sweep_runs_combustion_once(self):
+        """Test that sweeping a vessel parameter reuses the combustion result."""
+        config = SimulationConfig(
+            vessel_volume=0.001,
+            fuel_oxidizer_ratio=2.0,
+            combustion_time=0.001
+        )
+        thicknesses = [0.0003, 0.0004, 0.0005]
+
+        with patch(
+            "rocket_sim.system_model.system_integrator.simulate_combustion",
+            wraps=simulate_combustion
+        ) as combustion:
+            results = run_parametric_study(config, "vessel_thickness", thicknesses)
+
+        assert combustion.call_count == 1
+        assert all(comb is results[0][1] for _, comb, _ in results)
+        # Thicker walls give higher safety factors under the same pressure
+        min_sf = [np.min(sys_result.safety_factor) for _, _, sys_result in results]
+        assert min_sf[0] < min_sf[1] < min_sf[2]
+
+    def test_shared_cache_reuses_combustion_across_studies(self):
+        """Test that studies sharing a cache run each combustion case once."""
+        config = SimulationConfig(
+            vessel_volume=0.001,
+            fuel_oxidizer_ratio=2.0,
+            combustion_time=0.001
+        )
+        cache = {}
+
+        with patch(
+            "rocket_sim.system_model.system_integrator.simulate_combustion",
+            wraps=simulate_combustion
+        ) as combustion:
+            ratios = run_parametric_study(config, "fuel_oxidizer_ratio", [1.5, 2.0],
+                                          combustion_cache=cache)
+            walls = run_parametric_study(config, "vessel_thickness", [0.0003, 0.0004],
+                                         combustion_cache=cache)
+
+        # The base configuration appears in both studies but runs once
+        assert combustion.call_count == 2
+        assert len(cache) == 2
+        assert all(comb is ratios[1][1] for _, comb, _ in walls)
+
+    def test_parallel_vessel_sweep_shares_combustion(self):
+        """Test that worker processes run each distinct combustion case once."""
+        config = SimulationConfig(
+            vessel_volume=0.001,
+            fuel_oxidizer_ratio=2.0,
+            combustion_time=0.001
+        )
+        thicknesses = [0.0003, 0.0004, 0.0005]
+
+        serial = run_parametric_study(config, "vessel_thickness", thicknesses)
+        parallel = run_parametric_study(config, "vessel_thickness", thicknesses,
+                                        max_workers=2)
+
+        assert all(comb is parallel[0][1] for _, comb, _ in parallel)
+        for (_, _, sys_s), (_, _, sys_p) in zip(serial, parallel):
+            assert np.allclose(sys_s.safety_factor, sys_p.safety_factor)
+
+    def test_summary_arrays_match_results(self):
+        """Test that the per-metric summary matches the individual runs."""
+        config = SimulationConfig(
+            vessel_volume=0.001,
+            fuel_oxidizer_ratio=2.0,
+            combustion_time=0.001
+        )
+        values = [1.5, 2.0, 2.5]
+        results = run_parametric_study(config, "fuel_oxidizer_ratio", values)
+
+        summary = summarize_parametric_study(results)
+
+        assert np.array_equal(summary['parameter_value'], values)
+        for i, (_, _, sys_result) in enumerate(results):
+            assert summary['peak_pressure'][i] == np.max(sys_result.pressure)
+            assert summary['min_safety_factor'][i] == np.min(sys_result.safety_factor)
+            assert summary['failed'][i] == sys_result.failed
+            if not sys_result.failed:
+                assert np.isnan(summary['failure_time'][i])
+
 
 class TestDataExport:
     """Test data export functionality."""
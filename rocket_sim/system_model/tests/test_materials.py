@@ -4,6 +4,8 @@ Unit tests for materials module
 ISO/IEC/IEEE 12207:2017 - Verification Process
 """
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 from rocket_sim.system_model.materials import (
     MaterialProperties,
@@ -11,7 +13,9 @@ from rocket_sim.system_model.materials import (
     list_available_materials,
     get_material_summary,
     get_bottle_material,
-    MATERIALS
+    get_material_table,
+    MATERIALS,
+    MATERIAL_NAMES,
 )
 
 
@@ -91,6 +95,18 @@ class TestMaterialProperties:
         assert mat.name == "Test Material"
         assert mat.yield_strength == 50e6
 
+    def test_material_properties_are_immutable(self):
+        """Shared database entries cannot be modified in place."""
+        pet = get_material("PET")
+        with pytest.raises(FrozenInstanceError):
+            pet.yield_strength = 1.0
+        assert get_material("PET").yield_strength == MATERIALS["PET"].yield_strength
+
+    def test_material_database_is_read_only(self):
+        """The module-level database cannot be modified."""
+        with pytest.raises(TypeError):
+            MATERIALS["PET"] = MATERIALS["HDPE"]
+
     def test_pet_properties_realistic(self):
         """Test that PET properties are in realistic range."""
         pet = get_material("PET")
@@ -156,6 +172,42 @@ class TestMaterialSummary:
         assert "Source" in summary
 
 
+class TestMaterialTable:
+    """Test the structured-array view of the database."""
+
+    def test_table_rows_match_database(self):
+        """Test that each record holds the same values as get_material."""
+        table = get_material_table()
+        assert len(table) == len(MATERIAL_NAMES)
+        for name, record in zip(MATERIAL_NAMES, table):
+            mat = get_material(name)
+            assert record["yield_strength"] == mat.yield_strength
+            assert record["density"] == mat.density
+
+    def test_table_selection_by_name(self):
+        """Test selecting rows by (case-insensitive) name."""
+        table = get_material_table(["hdpe", "PET"])
+        assert list(table["tensile_strength"]) == [
+            get_material("HDPE").tensile_strength,
+            get_material("PET").tensile_strength,
+        ]
+
+    def test_table_unknown_material(self):
+        """Test that unknown names raise like get_material."""
+        with pytest.raises(ValueError):
+            get_material_table(["Unobtainium"])
+
+    def test_table_sweeps_burst_pressure(self):
+        """Test that a table stands in for one material in burst sizing."""
+        from rocket_sim.system_model import VesselGeometry, calculate_burst_pressure
+
+        geometry = VesselGeometry(inner_diameter=0.095, wall_thickness=0.0003)
+        names = ["PET", "HDPE", "Steel_304"]
+        burst = calculate_burst_pressure(geometry, get_material_table(names))
+        expected = [calculate_burst_pressure(geometry, get_material(n)) for n in names]
+        assert burst == pytest.approx(expected)
+
+
 class TestMaterialComparisons:
     """Test comparisons between different materials."""
 
@@ -10,17 +10,79 @@ ISO/IEC/IEEE 12207:2017 - Implementation Process
 Requirements: FR-8 (Visualization tools)
 """
 
-import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.figure import Figure
-from typing import Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import List, Optional, Tuple
 import warnings
 
 # Suppress matplotlib warnings
 warnings.filterwarnings('ignore', category=UserWarning, module='matplotlib')
 
+# Resolution for saved figures. 150 dpi is plenty for reports and encodes
+# ~4x fewer pixels than 300 dpi; pass dpi=300 for print-quality output.
+DEFAULT_DPI = 150
 
-def plot_pressure_temperature_time(result, save_path: Optional[str] = None, show: bool = True) -> Figure:
+# zlib level for saved PNGs. Level 1 deflates much faster than Pillow's
+# default (6) at the cost of somewhat larger files, which suits batch runs
+PNG_COMPRESS_LEVEL = 1
+
+
+# Safety factor reference lines: (value, color, linestyle, linewidth, label)
+_SAFETY_THRESHOLDS = (
+    (1.0, 'red', '--', 2.0, 'Failure Threshold (SF=1)'),
+    (2.0, 'orange', ':', 1.5, 'Recommended Min (SF=2)'),
+)
+
+
+def _mark_safety_thresholds(ax, labels: bool = True) -> None:
+    """Draw the SF=1 failure and SF=2 recommended-minimum reference lines."""
+    for value, color, linestyle, linewidth, label in _SAFETY_THRESHOLDS:
+        ax.axhline(value, color=color, linestyle=linestyle, linewidth=linewidth,
+                   label=label if labels else None)
+
+
+def _new_figure(figsize: Tuple[float, float], show: bool) -> Figure:
+    """
+    Create an empty figure.
+
+    Only figures that will be shown go through pyplot. The others are plain
+    Figure objects on an Agg canvas: they skip pyplot's figure manager and
+    global registry, so headless batch runs neither pay for registration
+    nor accumulate open figures, and each figure is independent of the
+    others.
+    """
+    if show:
+        return plt.figure(figsize=figsize)
+
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _finish_figure(fig: Figure, save_path: Optional[str], show: bool,
+                   dpi: int = DEFAULT_DPI) -> None:
+    """
+    Save and/or display a finished figure.
+
+    Figures that are not shown were never registered with pyplot (see
+    _new_figure), so there is nothing to close afterwards.
+    """
+    if save_path:
+        kwargs = {}
+        if str(save_path).lower().endswith('.png'):
+            kwargs['pil_kwargs'] = {'compress_level': PNG_COMPRESS_LEVEL}
+        fig.savefig(save_path, dpi=dpi, bbox_inches='tight', **kwargs)
+
+    if show:
+        plt.show()
+
+
+def plot_pressure_temperature_time(result, save_path: Optional[str] = None, show: bool = True,
+                                   dpi: int = DEFAULT_DPI) -> Figure:
     """
     Plot pressure and temperature vs time on dual y-axis.
 
@@ -28,6 +90,7 @@ def plot_pressure_temperature_time(result, save_path: Optional[str] = None, show
         result: FullSimulationResult object
         save_path: Optional path to save figure
         show: Whether to display plot
+        dpi: Resolution of the saved figure
 
     Returns:
         matplotlib Figure object
@@ -36,13 +99,20 @@ def plot_pressure_temperature_time(result, save_path: Optional[str] = None, show
         >>> fig = plot_pressure_temperature_time(result)
         >>> plt.show()
     """
-    fig, ax1 = plt.subplots(figsize=(10, 6))
+    fig = _new_figure((10, 6), show)
+    ax1 = fig.subplots()
+
+    system = result.system
+    config = result.config
+
+    # Time axis in ms, shared by both curves
+    time_ms = system.time * 1000
 
     # Pressure on left axis
     color = 'tab:blue'
     ax1.set_xlabel('Time (ms)', fontsize=12)
     ax1.set_ylabel('Pressure (bar)', color=color, fontsize=12)
-    ax1.plot(result.system.time * 1000, result.system.pressure / 1e5,
+    ax1.plot(time_ms, system.pressure / 1e5,
              color=color, linewidth=2, label='Pressure')
     ax1.tick_params(axis='y', labelcolor=color)
     ax1.grid(True, alpha=0.3)
@@ -51,35 +121,37 @@ def plot_pressure_temperature_time(result, save_path: Optional[str] = None, show
     ax2 = ax1.twinx()
     color = 'tab:red'
     ax2.set_ylabel('Temperature (K)', color=color, fontsize=12)
-    ax2.plot(result.system.time * 1000, result.system.temperature,
+    ax2.plot(time_ms, system.temperature,
              color=color, linewidth=2, linestyle='--', label='Temperature')
     ax2.tick_params(axis='y', labelcolor=color)
 
-    # Title and legend
-    plt.title(f'Pressure and Temperature Evolution\n'
-              f'{result.config.volume*1000:.1f}L, MR={result.config.fuel_oxidizer_ratio:.1f}, '
-              f'{result.config.vessel_material}',
-              fontsize=14, fontweight='bold')
+    # Title on the axes handle (plt.title would target the current axes,
+    # which is the twin temperature axis here)
+    ax1.set_title(f'Pressure and Temperature Evolution\n'
+                  f'{config.volume*1000:.1f}L, MR={config.fuel_oxidizer_ratio:.1f}, '
+                  f'{config.vessel_material}',
+                  fontsize=14, fontweight='bold')
 
     # Add failure marker if applicable
-    if result.failed and result.system.failure_time:
-        ax1.axvline(result.system.failure_time * 1000, color='red',
+    if result.failed and system.failure_time:
+        failure_ms = system.failure_time * 1000
+        ax1.axvline(failure_ms, color='red',
                    linestyle=':', linewidth=2, label='Failure')
-        ax1.text(result.system.failure_time * 1000, ax1.get_ylim()[1] * 0.9,
-                'FAILURE', rotation=90, va='top', color='red', fontweight='bold')
+        # Place the label in axes-fraction y so it needs no ylim lookup and
+        # stays put if the axis limits change afterwards
+        ax1.text(failure_ms, 0.9, 'FAILURE',
+                 transform=ax1.get_xaxis_transform(),
+                 rotation=90, va='top', color='red', fontweight='bold')
 
     fig.tight_layout()
 
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-
-    if show:
-        plt.show()
+    _finish_figure(fig, save_path, show, dpi)
 
     return fig
 
 
-def plot_stress_distribution(result, save_path: Optional[str] = None, show: bool = True) -> Figure:
+def plot_stress_distribution(result, save_path: Optional[str] = None, show: bool = True,
+                             dpi: int = DEFAULT_DPI) -> Figure:
     """
     Plot stress distribution through wall thickness.
 
@@ -89,18 +161,22 @@ def plot_stress_distribution(result, save_path: Optional[str] = None, show: bool
         result: FullSimulationResult object
         save_path: Optional path to save figure
         show: Whether to display plot
+        dpi: Resolution of the saved figure
 
     Returns:
         matplotlib Figure object
     """
-    fig, ax = plt.subplots(figsize=(10, 6))
-
-    # Get FEM data
-    r = np.array(result.fem_analysis['lame_solution']['r'])
-    sigma_hoop = np.array(result.fem_analysis['lame_solution']['sigma_hoop']) / 1e6  # MPa
-    sigma_radial = np.array(result.fem_analysis['lame_solution']['sigma_radial']) / 1e6
-    sigma_axial = np.array(result.fem_analysis['lame_solution']['sigma_axial']) / 1e6
-    sigma_vm = np.array(result.fem_analysis['lame_solution']['sigma_vm']) / 1e6
+    fig = _new_figure((10, 6), show)
+    ax = fig.subplots()
+
+    # Get FEM data (stored as arrays, so no list conversion is needed)
+    lame = result.fem_analysis['lame_solution']
+    summary = result.summary
+    r = lame['r']
+    sigma_hoop = lame['sigma_hoop'] / 1e6  # MPa
+    sigma_radial = lame['sigma_radial'] / 1e6
+    sigma_axial = lame['sigma_axial'] / 1e6
+    sigma_vm = lame['sigma_vm'] / 1e6
 
     # Convert radius to position through thickness
     r_inner = r[0]
@@ -125,7 +201,7 @@ def plot_stress_distribution(result, save_path: Optional[str] = None, show: bool
     ax.set_xlabel('Position Through Thickness (0=inner, 1=outer)', fontsize=12)
     ax.set_ylabel('Stress (MPa)', fontsize=12)
     ax.set_title(f'Stress Distribution Through Wall\n'
-                f'Peak Pressure: {result.summary["peak_pressure"]/1e5:.2f} bar, '
+                f'Peak Pressure: {summary["peak_pressure"]/1e5:.2f} bar, '
                 f'Thickness: {thickness*1000:.3f} mm',
                 fontsize=14, fontweight='bold')
     ax.legend(loc='best', fontsize=10)
@@ -133,16 +209,13 @@ def plot_stress_distribution(result, save_path: Optional[str] = None, show: bool
 
     fig.tight_layout()
 
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-
-    if show:
-        plt.show()
+    _finish_figure(fig, save_path, show, dpi)
 
     return fig
 
 
-def plot_safety_factor_evolution(result, save_path: Optional[str] = None, show: bool = True) -> Figure:
+def plot_safety_factor_evolution(result, save_path: Optional[str] = None, show: bool = True,
+                                 dpi: int = DEFAULT_DPI) -> Figure:
     """
     Plot safety factor evolution over time.
 
@@ -152,36 +225,42 @@ def plot_safety_factor_evolution(result, save_path: Optional[str] = None, show:
         result: FullSimulationResult object
         save_path: Optional path to save figure
         show: Whether to display plot
+        dpi: Resolution of the saved figure
 
     Returns:
         matplotlib Figure object
     """
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = _new_figure((10, 6), show)
+    ax = fig.subplots()
+
+    system = result.system
+    summary = result.summary
+
+    # Time axis in ms, shared by the curve and the shaded zones
+    time_ms = system.time * 1000
 
     # Plot safety factor
-    ax.plot(result.system.time * 1000, result.system.safety_factor,
+    ax.plot(time_ms, system.safety_factor,
             'b-', linewidth=2, label='Safety Factor (thin-wall)')
 
-    # Failure threshold
-    ax.axhline(1.0, color='red', linestyle='--', linewidth=2, label='Failure Threshold (SF=1)')
-
-    # Recommended minimum
-    ax.axhline(2.0, color='orange', linestyle=':', linewidth=1.5, label='Recommended Min (SF=2)')
+    # Failure threshold and recommended minimum
+    _mark_safety_thresholds(ax)
 
     # Add safety factor with stress concentrations
-    SF_conc = result.summary['safety_factor_with_concentration']
+    SF_conc = summary['safety_factor_with_concentration']
     ax.axhline(SF_conc, color='purple', linestyle='-.', linewidth=1.5,
               label=f'With Stress Concentrations (SF={SF_conc:.2f})')
 
-    # Shaded regions
-    ax.fill_between(result.system.time * 1000, 0, 1, alpha=0.2, color='red', label='Failure Zone')
-    ax.fill_between(result.system.time * 1000, 1, 2, alpha=0.1, color='orange', label='Danger Zone')
+    # Shaded regions (constant bands, so the span endpoints suffice)
+    t_span = time_ms[[0, -1]]
+    ax.fill_between(t_span, 0, 1, alpha=0.2, color='red', label='Failure Zone')
+    ax.fill_between(t_span, 1, 2, alpha=0.1, color='orange', label='Danger Zone')
 
     # Labels and formatting
     ax.set_xlabel('Time (ms)', fontsize=12)
     ax.set_ylabel('Safety Factor', fontsize=12)
     ax.set_title(f'Safety Factor Evolution\n'
-                f'Min SF: {result.summary["min_safety_factor"]:.2f}, '
+                f'Min SF: {summary["min_safety_factor"]:.2f}, '
                 f'Status: {"❌ FAILED" if result.failed else "✅ Safe"}',
                 fontsize=14, fontweight='bold')
     ax.legend(loc='best', fontsize=9)
@@ -190,16 +269,13 @@ def plot_safety_factor_evolution(result, save_path: Optional[str] = None, show:
 
     fig.tight_layout()
 
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-
-    if show:
-        plt.show()
+    _finish_figure(fig, save_path, show, dpi)
 
     return fig
 
 
-def create_comprehensive_dashboard(result, save_path: Optional[str] = None, show: bool = True) -> Figure:
+def create_comprehensive_dashboard(result, save_path: Optional[str] = None, show: bool = True,
+                                   dpi: int = DEFAULT_DPI) -> Figure:
     """
     Create comprehensive multi-panel dashboard with all key visualizations.
 
@@ -207,72 +283,126 @@ def create_comprehensive_dashboard(result, save_path: Optional[str] = None, show
         result: FullSimulationResult object
         save_path: Optional path to save figure
         show: Whether to display plot
+        dpi: Resolution of the saved figure
 
     Returns:
         matplotlib Figure object with 4 subplots
     """
-    fig = plt.figure(figsize=(16, 10))
-    gs = fig.add_gridspec(2, 2, hspace=0.3, wspace=0.3)
+    fig = _new_figure((16, 10), show)
+    ((ax1, ax2), (ax3, ax4)) = fig.subplots(
+        2, 2, gridspec_kw={'hspace': 0.3, 'wspace': 0.3}
+    )
+
+    # The three time-history panels share one x-axis (limits and ticks)
+    ax2.sharex(ax1)
+    ax4.sharex(ax1)
+
+    system = result.system
+    config = result.config
+    summary = result.summary
+
+    # Time axis in ms, shared by the three time-history panels
+    time_ms = system.time * 1000
 
     # Panel 1: Pressure vs Time
-    ax1 = fig.add_subplot(gs[0, 0])
-    ax1.plot(result.system.time * 1000, result.system.pressure / 1e5, 'b-', linewidth=2)
+    ax1.plot(time_ms, system.pressure / 1e5, 'b-', linewidth=2)
     ax1.set_xlabel('Time (ms)')
     ax1.set_ylabel('Pressure (bar)')
     ax1.set_title('Pressure Evolution')
-    ax1.grid(True, alpha=0.3)
-    if result.failed and result.system.failure_time:
-        ax1.axvline(result.system.failure_time * 1000, color='red', linestyle=':', linewidth=2)
+    if result.failed and system.failure_time:
+        ax1.axvline(system.failure_time * 1000, color='red', linestyle=':', linewidth=2)
 
     # Panel 2: Temperature vs Time
-    ax2 = fig.add_subplot(gs[0, 1])
-    ax2.plot(result.system.time * 1000, result.system.temperature, 'r-', linewidth=2)
+    ax2.plot(time_ms, system.temperature, 'r-', linewidth=2)
     ax2.set_xlabel('Time (ms)')
     ax2.set_ylabel('Temperature (K)')
     ax2.set_title('Temperature Evolution')
-    ax2.grid(True, alpha=0.3)
 
     # Panel 3: Stress Distribution
-    ax3 = fig.add_subplot(gs[1, 0])
-    r = np.array(result.fem_analysis['lame_solution']['r'])
-    sigma_vm = np.array(result.fem_analysis['lame_solution']['sigma_vm']) / 1e6
+    lame = result.fem_analysis['lame_solution']
+    r = lame['r']
+    sigma_vm = lame['sigma_vm'] / 1e6
     position = (r - r[0]) / (r[-1] - r[0])
     ax3.plot(position, sigma_vm, 'k-', linewidth=2.5)
     ax3.set_xlabel('Position (0=inner, 1=outer)')
     ax3.set_ylabel('Von Mises Stress (MPa)')
     ax3.set_title('Stress Distribution')
-    ax3.grid(True, alpha=0.3)
 
     # Panel 4: Safety Factor
-    ax4 = fig.add_subplot(gs[1, 1])
-    ax4.plot(result.system.time * 1000, result.system.safety_factor, 'b-', linewidth=2)
-    ax4.axhline(1.0, color='red', linestyle='--', linewidth=2)
-    ax4.axhline(2.0, color='orange', linestyle=':', linewidth=1.5)
-    ax4.fill_between(result.system.time * 1000, 0, 1, alpha=0.2, color='red')
+    ax4.plot(time_ms, system.safety_factor, 'b-', linewidth=2)
+    _mark_safety_thresholds(ax4, labels=False)
+    ax4.fill_between(time_ms[[0, -1]], 0, 1, alpha=0.2, color='red')
     ax4.set_xlabel('Time (ms)')
     ax4.set_ylabel('Safety Factor')
     ax4.set_title('Safety Factor Evolution')
-    ax4.grid(True, alpha=0.3)
     ax4.set_ylim(bottom=0)
 
+    for ax in (ax1, ax2, ax3, ax4):
+        ax.grid(True, alpha=0.3)
+
     # Overall title
     fig.suptitle(f'PET Rocket Simulation Dashboard\n'
-                f'{result.config.volume*1000:.1f}L, MR={result.config.fuel_oxidizer_ratio:.1f}, '
-                f'{result.config.vessel_material}, Cap: {result.config.cap_type}\n'
+                f'{config.volume*1000:.1f}L, MR={config.fuel_oxidizer_ratio:.1f}, '
+                f'{config.vessel_material}, Cap: {config.cap_type}\n'
                 f'Status: {"❌ FAILED" if result.failed else "✅ Safe"} | '
-                f'Min SF: {result.summary["min_safety_factor"]:.2f} | '
-                f'Peak P: {result.summary["peak_pressure"]/1e5:.2f} bar',
+                f'Min SF: {summary["min_safety_factor"]:.2f} | '
+                f'Peak P: {summary["peak_pressure"]/1e5:.2f} bar',
                 fontsize=16, fontweight='bold')
 
-    if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-
-    if show:
-        plt.show()
+    _finish_figure(fig, save_path, show, dpi)
 
     return fig
 
 
+def _save_plot(plot, result, save_path: str, dpi: int) -> str:
+    """Render one plot to file without displaying it (worker entry point)."""
+    plot(result, save_path=save_path, show=False, dpi=dpi)
+    return save_path
+
+
+def save_all_plots(result, output_dir, prefix: str = "", dpi: int = DEFAULT_DPI,
+                   max_workers: Optional[int] = None) -> List[str]:
+    """
+    Save the pressure/temperature, stress, safety factor and dashboard plots.
+
+    The figures are independent, so they can be rendered in parallel by a
+    pool of worker processes.
+
+    Args:
+        result: FullSimulationResult object
+        output_dir: Directory for the PNG files (created if missing)
+        prefix: Optional file name prefix, e.g. a configuration name
+        dpi: Resolution of the saved figures
+        max_workers: Number of worker processes. None or 1 renders the
+                     figures serially in the calling process.
+
+    Returns:
+        Paths of the saved files, in the order listed above
+
+    Example:
+        >>> paths = save_all_plots(result, "figures", prefix="2L_flat_", max_workers=4)
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    plots = (
+        (plot_pressure_temperature_time, "pressure_temperature"),
+        (plot_stress_distribution, "stress_distribution"),
+        (plot_safety_factor_evolution, "safety_factor"),
+        (create_comprehensive_dashboard, "dashboard"),
+    )
+    functions = [plot for plot, _ in plots]
+    paths = [str(output_dir / f"{prefix}{name}.png") for _, name in plots]
+
+    if max_workers is not None and max_workers > 1:
+        n_workers = min(max_workers, len(plots))
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            return list(executor.map(_save_plot, functions, repeat(result),
+                                     paths, repeat(dpi)))
+
+    return [_save_plot(plot, result, path, dpi) for plot, path in zip(functions, paths)]
+
+
 # Demonstration
 if __name__ == "__main__":
     print("Visualization module loaded successfully.")
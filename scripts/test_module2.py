@@ -1,7 +1,7 @@
-"""Quick test of Module 2 functionality"""
+"""Quick test of Module 2 functionality
 
-import sys
-sys.path.insert(0, '.')
+Requires the package to be installed (``pip install -e .``).
+"""
 
 from rocket_sim.system_model.materials import get_material, list_available_materials
 from rocket_sim.system_model.burst_calculator import (
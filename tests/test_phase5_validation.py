@@ -283,6 +283,14 @@ class TestDataExport:
         json_str = json.dumps(data, indent=2)
         assert len(json_str) > 0
 
+    def test_config_export_to_dict(self):
+        """Verify the configuration exports every field by name."""
+        from dataclasses import asdict
+        config = FullSimulationConfig(volume=0.002, fuel_oxidizer_ratio=2.5,
+                                      cap_type="flat")
+
+        assert config.to_dict() == asdict(config)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "--tb=short"])